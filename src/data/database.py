@@ -20,6 +20,18 @@ logger = logging.getLogger(__name__)
 ENV_KEY_NAME = "TIMECLOCK_ENV_KEY"
 DB_FILE = "timeclock.db"
 
+# Per-connection SQLite tuning, applied by Peewee whenever a connection is opened:
+# WAL lets readers proceed during writes and needs a single fsync per commit,
+# busy_timeout waits on the RFID/UI thread race instead of raising "database is locked".
+SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 1,  # NORMAL - safe with WAL
+    'busy_timeout': 5000,
+    'temp_store': 2,  # MEMORY
+    'mmap_size': 128 * 1024 * 1024,
+    'cache_size': -20000,  # ~20 MB page cache
+}
+
 
 def _get_database():
     """
@@ -41,6 +53,7 @@ def _get_database():
                     'kdf_iter': 256000,  # Key derivation iterations
                     'cipher_page_size': 4096,
                     'cipher_use_hmac': True,
+                    **SQLITE_PRAGMAS,
                 }
             )
         except ImportError:
@@ -57,12 +70,16 @@ def _get_database():
     
     # Fallback to plain SQLite (development/unset key)
     from peewee import SqliteDatabase
-    return SqliteDatabase(DB_FILE)
+    return SqliteDatabase(DB_FILE, pragmas=SQLITE_PRAGMAS)
 
 
 # Initialize database connection
 db = _get_database()
 
+# Short-lived cache of the active employee roster (see get_cached_employees)
+EMPLOYEE_CACHE_TTL_SECONDS = 5.0
+_employee_cache = {'ts': 0.0, 'data': None}
+
 # Employee-level locks to prevent concurrent modifications
 _employee_locks = {}
 _locks_lock = threading.Lock()
@@ -70,10 +87,12 @@ _locks_lock = threading.Lock()
 
 def _get_employee_lock(employee_id):
     """Get or create a lock for a specific employee"""
-    with _locks_lock:
-        if employee_id not in _employee_locks:
-            _employee_locks[employee_id] = threading.Lock()
-        return _employee_locks[employee_id]
+    # Locks are never removed, so an existing one can be read without the guard lock
+    lock = _employee_locks.get(employee_id)
+    if lock is None:
+        with _locks_lock:
+            lock = _employee_locks.setdefault(employee_id, threading.Lock())
+    return lock
 
 
 class BaseModel(Model):
@@ -105,8 +124,12 @@ class TimeEntry(BaseModel):
 
     class Meta:
         indexes = (
-            (('employee', 'timestamp'), False),  # Composite index for queries
-            (('timestamp',), False),  # Index for sorting
+            # Composite index for per-employee queries, which all filter on active too:
+            # day/range loads become a single index range, and SQLite walks it backwards
+            # for the "last entry [before ts]" lookups (ORDER BY timestamp DESC LIMIT 1),
+            # so no sort step or separate DESC index is needed. The plain timestamp index
+            # comes from index=True on the field.
+            (('employee', 'active', 'timestamp'), False),
         )
 
     def __str__(self):
@@ -174,6 +197,10 @@ def ensure_db_connection(max_retries=3, initial_delay=0.1):
     """
     Ensure database connection is open with retry logic for transient errors.
     
+    Connections are per thread. The UI thread opens its connection once startup
+    has finished and keeps it until the app stops, so on the hot path this is a
+    single is_closed() check.
+    
     Args:
         max_retries: Maximum number of retry attempts (default: 3)
         initial_delay: Initial delay in seconds before first retry (default: 0.1)
@@ -221,13 +248,22 @@ def _ensure_timeentry_active_column():
     try:
         rows = db.execute_sql("PRAGMA table_info(timeentry)").fetchall()
         columns = [row[1] for row in rows]
-        if 'active' not in columns:
+        if rows and 'active' not in columns:
             db.execute_sql("ALTER TABLE timeentry ADD COLUMN active BOOLEAN NOT NULL DEFAULT 1")
             logger.info("Added 'active' column to TimeEntry table")
     except Exception as exc:
         logger.debug(f"Could not ensure active column: {exc}")
 
 
+def _drop_legacy_timeentry_indexes():
+    """Drop indexes superseded by the (employee, active, timestamp) index"""
+    ensure_db_connection()
+    try:
+        db.execute_sql("DROP INDEX IF EXISTS timeentry_employee_id_timestamp")
+    except Exception as exc:
+        logger.debug(f"Could not drop legacy TimeEntry index: {exc}")
+
+
 def _ensure_lgav_day_entry_table():
     """Ensure LgavDayEntry table exists"""
     ensure_db_connection()
@@ -239,21 +275,22 @@ def _ensure_lgav_day_entry_table():
 
 
 def soft_delete_time_entries(entry_ids):
-    """Soft-delete specific time entries (set active=False) with transaction and error handling"""
+    """
+    Soft-delete specific time entries (set active=False) with transaction and error handling.
+    
+    Callers may run this inside their own transaction; the atomic block below is then
+    only a savepoint.
+    """
     if not entry_ids:
         return 0
     ensure_db_connection()
     try:
         with db.atomic():
-            result = TimeEntry.update(active=False).where(TimeEntry.id.in_(entry_ids)).execute()
-            db.commit()  # Explicit commit
-            return result
+            return TimeEntry.update(active=False).where(TimeEntry.id.in_(entry_ids)).execute()
     except Exception as e:
+        # atomic() has already rolled back its own transaction or savepoint; a caller's
+        # enclosing transaction is left to the caller
         logger.error(f"Failed to soft-delete time entries: {e}")
-        try:
-            db.rollback()
-        except:
-            pass
         raise
 
 
@@ -268,8 +305,11 @@ def initialize_db():
         else:
             logger.warning("Database is NOT encrypted!")
         
-        db.create_tables([Employee, TimeEntry], safe=True)
+        # Older databases lack TimeEntry.active, which the composite index created
+        # by create_tables needs, so add the column first
         _ensure_timeentry_active_column()
+        db.create_tables([Employee, TimeEntry], safe=True)
+        _drop_legacy_timeentry_indexes()
         _ensure_lgav_day_entry_table()
         db.commit()
         logger.info("Database initialized successfully")
@@ -316,6 +356,32 @@ def get_all_employees(include_inactive=False):
     return query.order_by(Employee.name)
 
 
+def get_cached_employees(ttl=EMPLOYEE_CACHE_TTL_SECONDS):
+    """
+    Get active employees as a list, reusing the last result for up to `ttl` seconds.
+    
+    The roster rarely changes, so screens that refresh their employee list on every
+    visit use this instead of hitting the database each time. The cache is
+    invalidated whenever an employee is created.
+    
+    Args:
+        ttl: Maximum age of the cached list in seconds
+        
+    Returns:
+        List of active Employee objects ordered by name
+    """
+    now = time.monotonic()
+    if _employee_cache['data'] is None or now - _employee_cache['ts'] >= ttl:
+        _employee_cache['data'] = list(get_all_employees(include_inactive=False))
+        _employee_cache['ts'] = now
+    return _employee_cache['data']
+
+
+def invalidate_employee_cache():
+    """Drop the cached employee roster so the next lookup hits the database"""
+    _employee_cache['data'] = None
+
+
 def get_admin_count():
     """Get count of active admin employees"""
     ensure_db_connection()
@@ -335,15 +401,13 @@ def create_employee(name, rfid_tag, is_admin=False):
     ensure_db_connection()
 
     try:
+        # atomic() commits on exit, so the employee is persisted once the block ends
         with db.atomic():
             employee = Employee.create(
                 name=name.strip(),
                 rfid_tag=rfid_tag.strip().upper(),
                 is_admin=bool(is_admin)
             )
-            db.commit()  # Explicit commit to ensure data is persisted
-            logger.info(f"Employee created successfully: {employee.name} ({employee.rfid_tag})")
-            return employee
     except IntegrityError as e:
         logger.error(f"Failed to create employee (integrity error): {e}")
         db.rollback()
@@ -355,6 +419,9 @@ def create_employee(name, rfid_tag, is_admin=False):
         except:
             pass
         raise
+    invalidate_employee_cache()
+    logger.info(f"Employee created successfully: {employee.name} ({employee.rfid_tag})")
+    return employee
 
 
 def create_time_entry(employee, action, timestamp=None):
@@ -391,15 +458,13 @@ def create_time_entry(employee, action, timestamp=None):
     ensure_db_connection()
 
     try:
+        # atomic() commits on exit, so the entry is persisted once the block ends
         with db.atomic():
             entry = TimeEntry.create(
                 employee=employee,
                 action=action,
                 timestamp=timestamp
             )
-            db.commit()  # Explicit commit to ensure data is persisted
-            logger.info(f"Time entry created: {employee.name} - {action.upper()} @ {timestamp}")
-            return entry
     except Exception as e:
         logger.error(f"Failed to create time entry: {e}")
         try:
@@ -407,6 +472,8 @@ def create_time_entry(employee, action, timestamp=None):
         except:
             pass
         raise
+    logger.info(f"Time entry created: {employee.name} - {action.upper()} @ {timestamp}")
+    return entry
 
 
 def create_time_entry_atomic(employee):
@@ -435,7 +502,9 @@ def create_time_entry_atomic(employee):
         ensure_db_connection()
         
         try:
-            with db.atomic():
+            # IMMEDIATE takes the write lock up front, so the read below can't race another
+            # writer and the later INSERT never has to upgrade a shared lock (SQLITE_BUSY)
+            with db.atomic('IMMEDIATE'):
                 # Get last entry within transaction to prevent race conditions
                 last_entry = TimeEntry.get_last_for_employee(employee)
                 
@@ -453,22 +522,24 @@ def create_time_entry_atomic(employee):
                     action=action,
                     timestamp=timestamp
                 )
-                db.commit()  # Explicit commit to ensure data is persisted
-                logger.info(f"Time entry created atomically: {employee.name} - {action.upper()} @ {timestamp}")
-                return entry, action
+            # Leaving the atomic block commits read + insert as one transaction
+            logger.info(f"Time entry created atomically: {employee.name} - {action.upper()} @ {timestamp}")
+            return entry, action
         except Exception as e:
             logger.error(f"Failed to create time entry atomically: {e}")
             try:
                 db.rollback()
             except:
                 pass
-        raise
+            raise
 
 
 def get_time_entries_for_export():
     """Get all time entries formatted for CSV export"""
     ensure_db_connection()
-    return TimeEntry.select().join(Employee).where(
+    # Select the employee columns from the join too, so entry.employee is populated
+    # from the same row instead of one extra query per exported entry
+    return TimeEntry.select(TimeEntry, Employee).join(Employee).where(
         Employee.active == True,
         TimeEntry.active == True
     ).order_by(TimeEntry.timestamp.desc())
@@ -498,6 +569,7 @@ def create_lgav_day_entry(employee, date, upper_code=None, lower_code=None,
         raise ValueError("Cannot create L-GAV entry for inactive employee")
     
     try:
+        # atomic() commits when the block is left, including via return
         with db.atomic():
             # Try to get existing entry
             try:
@@ -513,7 +585,6 @@ def create_lgav_day_entry(employee, date, upper_code=None, lower_code=None,
                 entry.notes = notes
                 entry.updated_at = datetime.datetime.now()
                 entry.save()
-                db.commit()  # Explicit commit
                 logger.info(f"Updated L-GAV entry for {employee.name} on {date}")
                 return entry
             except LgavDayEntry.DoesNotExist:
@@ -526,7 +597,6 @@ def create_lgav_day_entry(employee, date, upper_code=None, lower_code=None,
                     total_seconds=total_seconds,
                     notes=notes
                 )
-                db.commit()  # Explicit commit
                 logger.info(f"Created L-GAV entry for {employee.name} on {date}")
                 return entry
     except IntegrityError as e:
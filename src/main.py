@@ -14,6 +14,9 @@ See ARCHITECTURE.md for detailed architecture documentation.
 
 import logging
 import datetime
+import threading
+from collections import deque
+from functools import partial
 
 # IMPORTANT: Config must be set BEFORE importing Kivy modules
 from kivy.config import Config
@@ -35,11 +38,13 @@ Config.set('kivy', 'keyboard_layout', 'qwerty')
 # Now import Kivy modules
 from kivy.app import App
 from kivy.uix.screenmanager import ScreenManager
+from kivy.uix.popup import Popup
+from kivy.uix.label import Label
 from kivy.clock import Clock
 from kivy.core.window import Window
 
 from .data.database import (
-    initialize_db, close_db,
+    initialize_db, close_db, ensure_db_connection,
     get_employee_by_tag, get_admin_count
 )
 from .hardware.rfid import get_rfid_provider
@@ -53,16 +58,8 @@ from .services.popup_service import PopupService
 # Import extracted widgets (needed for KV file imports)
 from .presentation.widgets import DebouncedButton, FilteredTextInput
 
-# Import extracted popups
-from .presentation.popups import (
-    GreeterPopup,
-    BadgeIdentificationPopup,
-    EntryEditorPopup,
-    LimitedDatePickerPopup,
-    DatePickerPopup,
-    TimePickerPopup,
-    AddEntryPopup,
-)
+# Popups are resolved lazily on first use (see presentation/popups/__init__.py)
+from .presentation import popups
 
 # Import extracted screens
 from .presentation.screens import (
@@ -118,8 +115,9 @@ class WindowManager(ScreenManager):
 class TimeClockApp(App):
     """Main application - refactored to use services"""
     
-    idle_seconds = 0
     MAX_IDLE_SECONDS = 60  # Start screensaver after 60 seconds
+    ACTIVITY_DEBOUNCE_SECONDS = 0.5  # Handle at most one motion event per interval
+    INIT_FAILURE_EXIT_SECONDS = 10  # Show a failed startup this long before exiting
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -128,6 +126,19 @@ class TimeClockApp(App):
         self.popup_service = PopupService()
         self.clock_service = None  # Will be initialized after RFID is ready
         self.rfid = None
+        self._init_done = False  # Set once DB and RFID are ready (see _background_init)
+        self._init_popup = None  # Blocks the UI until _background_init has finished
+        self.previous_screen = None  # Screen shown before the screensaver started
+        self._view_sessions_popup = None  # Reused across report views
+        # Tags pushed by the RFID thread, drained on the UI thread by one coalescing trigger
+        self._scan_queue = deque()
+        self._scan_trigger = Clock.create_trigger(self._drain_scans)
+        self._idle_event = None  # One-shot screensaver timer, re-armed on activity
+        self._last_activity_ts = 0.0
+        # Screens used on the scan path, resolved once in build()
+        self._timeclock_screen = None
+        self._register_screen = None
+        self._identify_screen = None
         
         # Set KV file path - Kivy will load it automatically with correct context
         import os
@@ -140,40 +151,101 @@ class TimeClockApp(App):
     def build(self):
         """Build UI - delegate to services"""
         
-        # Initialize database and RFID before returning root
-        initialize_db()
-        self.rfid = get_rfid_provider(self.on_rfid_scan, use_mock=False)  # Attempt real, fallback to mock
-        self.rfid.start()
+        # Keep the screens unreachable while the database may still be migrating
+        self._init_popup = Popup(
+            title="TimeClock",
+            content=Label(text="Initialisierung..."),
+            size_hint=(None, None),
+            size=(400, 200),
+            auto_dismiss=False
+        )
+        self._init_popup.open()
         
-        # Initialize clock service with RFID and other services
-        self.clock_service = ClockService(self.rfid, self.popup_service, self.state_service)
+        # Initialize database and RFID on a worker thread so the first frame isn't delayed
+        threading.Thread(target=self._background_init, daemon=True).start()
         
         # Idle Timer Setup
-        Clock.schedule_interval(self.check_idle, 1)
+        self._arm_idle_timer()
         Window.bind(on_motion=self.on_user_activity)
         
-        # Check if admin exists
-        self.check_initial_setup()
-        
-        # Root widget is automatically loaded from KV file by Kivy
+        # Root widget is automatically loaded from KV file by Kivy (before build runs),
+        # so the screens can be looked up once here instead of on every scan
+        self._timeclock_screen = self.root.get_screen('timeclock')
+        self._register_screen = self.root.get_screen('register')
+        self._identify_screen = self.root.get_screen('identify')
         return self.root
 
-    def check_idle(self, dt):
-        """Check if we should start screensaver"""
+    def _background_init(self):
+        """Open the database, start RFID and count admins (runs on a worker thread)"""
+        rfid = None
+        try:
+            initialize_db()
+            rfid = get_rfid_provider(self.on_rfid_scan, use_mock=False)  # Attempt real, fallback to mock
+            rfid.start()
+            admin_count = get_admin_count()
+        except Exception as e:
+            logger.error(f"Startup initialization failed: {e}")
+            Clock.schedule_once(partial(self._fail_init, rfid, str(e)), 0)
+            return
+        finally:
+            # Peewee connections are per thread; this one ends with the init thread
+            close_db()
+        Clock.schedule_once(partial(self._finish_init, rfid, admin_count), 0)
+
+    def _finish_init(self, rfid, admin_count, dt):
+        """Wire up services once background initialization is done (UI thread)"""
+        # The UI thread's connection is kept for the app lifetime and closed in on_stop
+        try:
+            ensure_db_connection()
+        except Exception as e:
+            logger.error(f"Opening the database connection failed: {e}")
+            self._fail_init(rfid, str(e), dt)
+            return
+        self.rfid = rfid
+        # Initialize clock service with RFID and other services
+        self.clock_service = ClockService(self.rfid, self.popup_service, self.state_service)
+        self._init_done = True
+        self._init_popup.dismiss()
+        self._init_popup = None
+        
+        # Check if admin exists
+        self.check_initial_setup(admin_count)
+
+    def _fail_init(self, rfid, message, dt):
+        """Report a failed startup and exit, so the kiosk restarts the app (UI thread)"""
+        # Stopped in on_stop if it was already started
+        self.rfid = rfid
+        label = self._init_popup.content
+        label.text = f"Initialisierung fehlgeschlagen:\n{message}\n\nDie Anwendung wird beendet."
+        label.color = (1, 0, 0, 1)  # Red text
+        label.halign = 'center'
+        label.text_size = (360, None)
+        Clock.schedule_once(lambda dt: self.stop(), self.INIT_FAILURE_EXIT_SECONDS)
+
+    def _arm_idle_timer(self):
+        """(Re)start the one-shot timer that activates the screensaver"""
+        if self._idle_event:
+            self._idle_event.cancel()
+        self._idle_event = Clock.schedule_once(self._on_idle_timeout, self.MAX_IDLE_SECONDS)
+
+    def _on_idle_timeout(self, dt):
+        """Start screensaver after MAX_IDLE_SECONDS without activity"""
         # Don't activate if already screensaver
         if self.root.current == 'screensaver':
             return
-            
-        self.idle_seconds += 1
-        if self.idle_seconds >= self.MAX_IDLE_SECONDS:
-            self.start_screensaver()
+        self.start_screensaver()
 
     def on_user_activity(self, window, etype, motionevent):
         """Reset idle timer on any touch/mouse movement"""
+        # Motion events arrive in bursts; re-arming the timer once per interval is enough
+        now = Clock.get_time()
+        if now - self._last_activity_ts < self.ACTIVITY_DEBOUNCE_SECONDS:
+            return
+        self._last_activity_ts = now
         self.reset_idle_timer()
 
     def reset_idle_timer(self, force_unlock=False):
-        self.idle_seconds = 0
+        self._arm_idle_timer()
         if force_unlock or self.root.current == 'screensaver':
             if self.root.current == 'screensaver':
                 self.stop_screensaver()
@@ -189,21 +261,35 @@ class TimeClockApp(App):
         # Stick to timeclock for now.
         self.root.current = target
 
-    def check_initial_setup(self):
-        if get_admin_count() == 0:
+    def check_initial_setup(self, admin_count=None):
+        if admin_count is None:
+            admin_count = get_admin_count()
+        if admin_count == 0:
             # No admin, force setup
             Clock.schedule_once(lambda dt: self.show_initial_setup(), 0.5)
 
     def show_initial_setup(self):
         """Show initial setup screen"""
         self.root.current = 'register'
-        self.root.get_screen('register').ids.admin_checkbox.active = True
-        self.root.get_screen('register').ids.admin_checkbox.disabled = True  # Force admin for first user
+        admin_checkbox = self._register_screen.ids.admin_checkbox
+        admin_checkbox.active = True
+        admin_checkbox.disabled = True  # Force admin for first user
         self.popup_service.show_info("Welcome", "Please register the initial Administrator.")
 
     def on_rfid_scan(self, tag_id):
-        # Schedule handling on main thread
-        Clock.schedule_once(lambda dt: self.handle_scan(tag_id), 0)
+        # Queue for handling on main thread (deque.append is thread-safe)
+        self._scan_queue.append(tag_id)
+        self._scan_trigger()
+
+    def _drain_scans(self, dt):
+        """Handle all queued scans on the main thread"""
+        while self._scan_queue:
+            tag_id = self._scan_queue.popleft()
+            # Scans can be queued before _finish_init has wired up the services
+            if not self._init_done:
+                logger.debug("Ignoring scan before initialization completed: %s", tag_id)
+                continue
+            self.handle_scan(tag_id)
 
     def handle_scan(self, tag_id):
         """Handle RFID scan - uses state service for debouncing"""
@@ -215,7 +301,7 @@ class TimeClockApp(App):
         
         # Check for recent scan (debounce) using state service
         if self.state_service.is_recent_scan(tag_id):
-            logger.debug(f"Ignoring duplicate scan for {tag_id}")
+            logger.debug("Ignoring duplicate scan for %s", tag_id)
             return
         
         # Check if tag belongs to an existing employee
@@ -240,7 +326,7 @@ class TimeClockApp(App):
             else:
                 # New tag
                 logger.debug(f"[RFID] New tag detected, setting tag_id to {tag_id.upper()}")
-                self.root.get_screen('register').tag_id = str(tag_id).upper()
+                self._register_screen.tag_id = str(tag_id).upper()
                 self.rfid.indicate_success()
             return
 
@@ -251,7 +337,7 @@ class TimeClockApp(App):
             else:
                 info = f"Tag ID: {tag_id}\nStatus: Unregistriert"
             
-            self.root.get_screen('identify').update_info(info)
+            self._identify_screen.update_info(info)
             return
 
         # Check for pending badge identification (for view/edit actions)
@@ -297,7 +383,7 @@ class TimeClockApp(App):
             
             # Update UI
             msg = f"Clocked {result.action.upper()} - {result.employee.name}"
-            self.root.get_screen('timeclock').update_status(msg)
+            self._timeclock_screen.update_status(msg)
             
             # Note: State is now updated by ClockService internally
         # Note: Errors are now handled by ClockService internally
@@ -320,7 +406,7 @@ class TimeClockApp(App):
     
     def _open_entry_editor(self, employee):
         """Open entry editor popup after delay"""
-        popup = EntryEditorPopup(
+        popup = popups.EntryEditorPopup(
             employee,
             on_deleted=lambda: self.state_service.clear_last_clocked_employee()
         )
@@ -338,17 +424,18 @@ class TimeClockApp(App):
     
     def _display_today_report(self, employee):
         """Display today's report for the given employee with date picker"""
-        from .presentation.popups.view_sessions_popup import ViewSessionsPopup
         # Close any existing main popups before opening new one
         self.popup_service.close_main_popup()
         # Small delay to ensure previous popup is fully closed
-        from kivy.clock import Clock
         Clock.schedule_once(lambda dt: self._open_view_sessions(employee), 0.1)
     
     def _open_view_sessions(self, employee):
-        """Open view sessions popup after delay"""
-        from .presentation.popups.view_sessions_popup import ViewSessionsPopup
-        popup = ViewSessionsPopup(employee)
+        """Open view sessions popup after delay, reusing the previous popup when closed"""
+        popup = self._view_sessions_popup
+        if popup is None or popup.parent is not None:
+            popup = self._view_sessions_popup = popups.ViewSessionsPopup(employee)
+        else:
+            popup.reset(employee)
         popup.open()
     
     def _request_badge_identification(self, action_type):
@@ -372,7 +459,7 @@ class TimeClockApp(App):
     def _open_badge_identification(self, action_type):
         """Open badge identification popup after delay"""
         # Create identification popup
-        popup = BadgeIdentificationPopup(
+        popup = popups.BadgeIdentificationPopup(
             action_type=action_type,
             on_identified=lambda emp: self._on_employee_identified(emp, action_type)
         )
@@ -389,7 +476,7 @@ class TimeClockApp(App):
         if action_type == 'view_report':
             self._display_today_report(employee)
         elif action_type == 'edit_sessions':
-            EntryEditorPopup(
+            popups.EntryEditorPopup(
                 employee,
                 on_deleted=lambda: self.state_service.clear_last_clocked_employee()
             ).open()
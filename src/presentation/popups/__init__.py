@@ -1,26 +1,37 @@
 """
 Popup components for TimeClock application.
+
+Popup modules are imported on first attribute access (PEP 562) so that
+app startup only pays for the Kivy widgets of popups that are actually used.
 """
+import importlib
+
+# Exported class name -> submodule that defines it
+_POPUP_MODULES = {
+    'GreeterPopup': '.greeter_popup',
+    'BadgeIdentificationPopup': '.badge_identification_popup',
+    'EntryEditorPopup': '.entry_editor_popup',
+    'LimitedDatePickerPopup': '.limited_date_picker_popup',
+    'DatePickerPopup': '.date_picker_popup',
+    'TimePickerPopup': '.time_picker_popup',
+    'HourPickerPopup': '.hour_picker_popup',
+    'MinutePickerPopup': '.minute_picker_popup',
+    'AddEntryPopup': '.add_entry_popup',
+    'ViewSessionsPopup': '.view_sessions_popup',
+}
+
+__all__ = list(_POPUP_MODULES)
+
 
-from .greeter_popup import GreeterPopup
-from .badge_identification_popup import BadgeIdentificationPopup
-from .entry_editor_popup import EntryEditorPopup
-from .limited_date_picker_popup import LimitedDatePickerPopup
-from .date_picker_popup import DatePickerPopup
-from .time_picker_popup import TimePickerPopup
-from .hour_picker_popup import HourPickerPopup
-from .minute_picker_popup import MinutePickerPopup
-from .add_entry_popup import AddEntryPopup
+def __getattr__(name):
+    """Import the popup class on first access and cache it on the package"""
+    module_name = _POPUP_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    'GreeterPopup',
-    'BadgeIdentificationPopup',
-    'EntryEditorPopup',
-    'LimitedDatePickerPopup',
-    'DatePickerPopup',
-    'TimePickerPopup',
-    'HourPickerPopup',
-    'MinutePickerPopup',
-    'AddEntryPopup',
-]
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
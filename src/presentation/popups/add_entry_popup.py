@@ -3,11 +3,14 @@ Add entry popup for manually adding time entries.
 """
 import datetime
 import logging
+from collections import OrderedDict
 from kivy.uix.popup import Popup
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.label import Label
 from kivy.app import App
+from kivy.clock import Clock
+from kivy.metrics import dp, sp
 
 from ..widgets import DebouncedButton
 from .limited_date_picker_popup import LimitedDatePickerPopup
@@ -19,8 +22,35 @@ logger = logging.getLogger(__name__)
 # Maximum lookback range for manual entry date selection.
 EDIT_SESSIONS_LOOKBACK_DAYS = 14
 
+# Most recent timestamps whose auto-determined action is remembered per popup
+ACTION_CACHE_SIZE = 32
+
+# Metric values resolved once instead of parsing '70dp'/'24sp' strings per widget
+_ROW_HEIGHT = dp(70)
+_FONT_LARGE = sp(24)
+_FONT_MEDIUM = sp(20)
+
+
+def _now_truncated():
+    """Return the current datetime truncated to the minute"""
+    return datetime.datetime.now().replace(second=0, microsecond=0)
+
 
 class AddEntryPopup(Popup):
+    # Action label text/color per action, looked up instead of rebuilt on every update
+    _ACTION_DISPLAY = {
+        'in': ("Action: IN (auto-determined)", (0.2, 0.8, 0.2, 1)),
+        'out': ("Action: OUT (auto-determined)", (0.8, 0.2, 0.2, 1)),
+    }
+    _DEFAULT_ACTION_DISPLAY = ("Action: IN (default)", (0.2, 0.8, 0.2, 1))
+    # Shared styling for the date and time picker buttons
+    _PICKER_BTN_KW = {
+        'size_hint_y': None,
+        'height': _ROW_HEIGHT,
+        'font_size': _FONT_LARGE,
+        'background_color': (0.2, 0.6, 0.9, 1),
+    }
+    
     def __init__(self, employee, on_save=None, initial_date=None, **kwargs):
         super().__init__(
             title=f"Manuellen Eintrag hinzufügen - {employee.name}",
@@ -30,12 +60,19 @@ class AddEntryPopup(Popup):
         )
         self.employee = employee
         self.on_save_callback = on_save
-        now = datetime.datetime.now()
+        now = _now_truncated()
         # Use initial_date if provided, otherwise use today
         self.selected_date = initial_date if initial_date else now.date()
-        self.selected_time = now.time().replace(second=0, microsecond=0)
+        self.selected_time = now.time()
         # Action will be auto-determined based on last entry before timestamp
         self.selected_action = None
+        self._saving = False
+        self._date_picker = None
+        self._time_picker = None
+        # Auto-determined action per timestamp (LRU), so re-picking a time doesn't re-query
+        self._action_cache = OrderedDict()
+        # Coalesce rapid date/time changes into a single action lookup
+        self._update_action_trigger = Clock.create_trigger(self._update_action_display, 0.2)
 
         # Main container with ScrollView
         main_layout = BoxLayout(orientation='vertical', spacing=0, padding=0)
@@ -59,32 +96,26 @@ class AddEntryPopup(Popup):
         
         # Date selection
         self.date_btn = DebouncedButton(
-            text=f"Datum: {self.selected_date.strftime('%d.%m.%Y')}",
-            size_hint_y=None,
-            height='70dp',
-            font_size='24sp',
-            background_color=(0.2, 0.6, 0.9, 1)
+            text=self._date_text(self.selected_date),
+            **self._PICKER_BTN_KW
         )
-        self.date_btn.bind(on_release=lambda *_: self._pick_date())
+        self.date_btn.bind(on_release=self._pick_date)
         layout.add_widget(self.date_btn)
 
         # Time selection
         self.time_btn = DebouncedButton(
-            text=f"Zeit: {self.selected_time.strftime('%H:%M')}",
-            size_hint_y=None,
-            height='70dp',
-            font_size='24sp',
-            background_color=(0.2, 0.6, 0.9, 1)
+            text=self._time_text(self.selected_time),
+            **self._PICKER_BTN_KW
         )
-        self.time_btn.bind(on_release=lambda *_: self._pick_time())
+        self.time_btn.bind(on_release=self._pick_time)
         layout.add_widget(self.time_btn)
 
         # Action display (auto-determined, read-only)
         self.action_label = Label(
             text="Action: Will be determined automatically",
             size_hint_y=None,
-            height='70dp',
-            font_size='20sp',
+            height=_ROW_HEIGHT,
+            font_size=_FONT_MEDIUM,
             halign='center',
             valign='middle',
             text_size=(None, None)
@@ -101,22 +132,22 @@ class AddEntryPopup(Popup):
             orientation='horizontal',
             spacing=15,
             size_hint_y=None,
-            height='70dp',
+            height=_ROW_HEIGHT,
             padding=(20, 10, 20, 10)
         )
         save_btn = DebouncedButton(
             text="Speichern",
             size_hint_x=0.5,
-            font_size='24sp',
+            font_size=_FONT_LARGE,
             background_color=(0, 0.7, 0, 1)
         )
         cancel_btn = DebouncedButton(
             text="Abbrechen",
             size_hint_x=0.5,
-            font_size='24sp',
+            font_size=_FONT_LARGE,
             background_color=(0.7, 0.2, 0.2, 1)
         )
-        save_btn.bind(on_release=lambda *_: self._save())
+        save_btn.bind(on_release=self._save)
         cancel_btn.bind(on_release=self.dismiss)
         btn_row.add_widget(save_btn)
         btn_row.add_widget(cancel_btn)
@@ -124,69 +155,113 @@ class AddEntryPopup(Popup):
 
         self.content = main_layout
 
-    def _pick_date(self):
+    def reset(self, initial_date=None, on_save=None):
+        """Prepare a cached popup for a new entry without rebuilding its widgets"""
+        self.on_save_callback = on_save
+        now = _now_truncated()
+        self.selected_date = initial_date if initial_date else now.date()
+        self.selected_time = now.time()
+        self.selected_action = None
+        # Entries may have changed since the last use
+        self._action_cache.clear()
+        self._update_action_trigger.cancel()
+        self.date_btn.text = self._date_text(self.selected_date)
+        self.time_btn.text = self._time_text(self.selected_time)
+        self._update_action_display()
+
+    def _pick_date(self, *_):
         """Open date picker, limiting to the configured edit lookback window."""
         today = datetime.date.today()
         min_date = today - datetime.timedelta(days=EDIT_SESSIONS_LOOKBACK_DAYS)
         
-        LimitedDatePickerPopup(
-            current_date=self.selected_date,
-            min_date=min_date,
-            max_date=today,
-            on_select=self._set_date
-        ).open()
-
-    def _pick_time(self):
-        # Store reference to prevent garbage collection before callback executes
-        self._time_picker = TimePickerPopup(
-            current_time=self.selected_time,
-            on_select=self._set_time
-        )
+        if self._date_picker is None:
+            self._date_picker = LimitedDatePickerPopup(
+                current_date=self.selected_date,
+                min_date=min_date,
+                max_date=today,
+                on_select=self._set_date
+            )
+        else:
+            self._date_picker.reset(self.selected_date, min_date, today, on_select=self._set_date)
+        self._date_picker.open()
+
+    def _pick_time(self, *_):
+        # Keep a single picker per popup; the reference also prevents garbage
+        # collection before the callback executes
+        if self._time_picker is None:
+            self._time_picker = TimePickerPopup(
+                current_time=self.selected_time,
+                on_select=self._set_time
+            )
+        else:
+            self._time_picker.reset(self.selected_time, on_select=self._set_time)
         self._time_picker.open()
 
+    @staticmethod
+    def _date_text(d):
+        """Date button label for the given date"""
+        return f"Datum: {d.day:02d}.{d.month:02d}.{d.year:04d}"
+
+    @staticmethod
+    def _time_text(t):
+        """Time button label for the given time"""
+        return f"Zeit: {t.hour:02d}:{t.minute:02d}"
+
     def _set_date(self, date_obj):
         self.selected_date = date_obj
-        self.date_btn.text = f"Datum: {self.selected_date.strftime('%d.%m.%Y')}"
-        self._update_action_display()
+        self.date_btn.text = self._date_text(date_obj)
+        self._update_action_trigger()
 
     def _set_time(self, time_obj):
         self.selected_time = time_obj
-        self.time_btn.text = f"Zeit: {self.selected_time.strftime('%H:%M')}"
-        self._update_action_display()
+        self.time_btn.text = self._time_text(time_obj)
+        self._update_action_trigger()
 
-    def _update_action_display(self):
+    def _update_action_display(self, *_):
         """Auto-determine action based on last entry before selected timestamp"""
         try:
-            ensure_db_connection()
             timestamp = datetime.datetime.combine(self.selected_date, self.selected_time)
-            last_entry = TimeEntry.get_last_before_timestamp(self.employee, timestamp)
-            
-            # Determine action: if no entry or last was 'out', next is 'in'; otherwise 'out'
-            if not last_entry or last_entry.action == 'out':
-                self.selected_action = 'in'
+            action = self._action_cache.get(timestamp)
+            if action is not None:
+                self._action_cache.move_to_end(timestamp)
             else:
-                self.selected_action = 'out'
+                ensure_db_connection()
+                last_entry = TimeEntry.get_last_before_timestamp(self.employee, timestamp)
+                
+                # Determine action: if no entry or last was 'out', next is 'in'; otherwise 'out'
+                if not last_entry or last_entry.action == 'out':
+                    action = 'in'
+                else:
+                    action = 'out'
+                self._action_cache[timestamp] = action
+                if len(self._action_cache) > ACTION_CACHE_SIZE:
+                    self._action_cache.popitem(last=False)
+            self.selected_action = action
             
-            # Update display
-            action_text = "IN" if self.selected_action == 'in' else "OUT"
-            action_color = (0.2, 0.8, 0.2, 1) if self.selected_action == 'in' else (0.8, 0.2, 0.2, 1)
-            self.action_label.text = f"Action: {action_text} (auto-determined)"
-            self.action_label.color = action_color
+            self._set_action_label(*self._ACTION_DISPLAY[self.selected_action])
         except Exception as e:
             logger.error(f"[ADD_ENTRY] Error determining action: {e}")
             self.selected_action = 'in'  # Default fallback
-            self.action_label.text = "Action: IN (default)"
-            self.action_label.color = (0.2, 0.8, 0.2, 1)
+            self._set_action_label(*self._DEFAULT_ACTION_DISPLAY)
+
+    def _set_action_label(self, text, color):
+        """Update the action label, touching only properties that changed"""
+        label = self.action_label
+        if label.text != text:
+            label.text = text
+        if tuple(label.color) != color:
+            label.color = color
 
-    def _save(self):
+    def _save(self, *_):
         # Prevent double-save (belt and suspenders with DebouncedButton fix)
-        if getattr(self, '_saving', False):
+        if self._saving:
             return
         self._saving = True
         
         try:
-            if self.selected_action is None:
-                # Ensure action is determined before saving
+            if self.selected_action is None or self._update_action_trigger.is_triggered:
+                # Ensure action is determined (and not stale) before saving
+                self._update_action_trigger.cancel()
                 self._update_action_display()
             
             ts = datetime.datetime.combine(self.selected_date, self.selected_time)
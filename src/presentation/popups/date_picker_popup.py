@@ -1,13 +1,14 @@
 """
 Date picker popup for selecting dates without constraints.
 """
+import calendar
 import datetime
 import logging
+from functools import partial
 from kivy.uix.popup import Popup
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
-from kivy.uix.widget import Widget
 from kivy.uix.button import Button
 from kivy.uix.scrollview import ScrollView
 from kivy.properties import ObjectProperty
@@ -16,11 +17,30 @@ from ..widgets import DebouncedButton
 
 logger = logging.getLogger(__name__)
 
+# The day grid always shows 6 weeks so its geometry never changes between months
+_CALENDAR_ROWS = 6
+_CALENDAR_SLOTS = _CALENDAR_ROWS * 7
+
+# Monday-first month layout; itermonthdays() yields whole weeks with 0 for padding cells
+_CALENDAR = calendar.Calendar(firstweekday=0)
+
+# (background, text) colors per day button state, shared with LimitedDatePickerPopup
+_SELECTED_COLORS = ((0.2, 0.6, 0.9, 1), (1, 1, 1, 1))
+_TODAY_COLORS = ((0.3, 0.7, 0.3, 1), (1, 1, 1, 1))
+_DEFAULT_COLORS = ((0.4, 0.4, 0.4, 1), (1, 1, 1, 1))
+
+# German month names, indexed by month number (1-12)
+_GERMAN_MONTHS = ('', 'Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
+                  'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember')
+
 
 class DatePickerPopup(Popup):
     """Date picker without date constraints"""
     selected_date = ObjectProperty(None, allownone=True)
     
+    # Weekday header labels (Monday first)
+    _DAY_NAMES = ('Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So')
+    
     def __init__(self, current_date=None, on_select=None, **kwargs):
         super().__init__(**kwargs)
         self.on_select_callback = on_select
@@ -50,10 +70,10 @@ class DatePickerPopup(Popup):
             size_hint_x=0.15,
             background_color=(0.3, 0.5, 0.7, 1)
         )
-        prev_month_btn.bind(on_release=lambda x: self._change_month(-1))
+        prev_month_btn.bind(on_release=partial(self._change_month, -1))
         
         month_year_label = Label(
-            text=f"{self._get_month_name(current_date.month)} {current_date.year}",
+            text=f"{_GERMAN_MONTHS[current_date.month]} {current_date.year}",
             font_size='22sp',
             size_hint_x=0.7,
             bold=True
@@ -65,7 +85,7 @@ class DatePickerPopup(Popup):
             size_hint_x=0.15,
             background_color=(0.3, 0.5, 0.7, 1)
         )
-        next_month_btn.bind(on_release=lambda x: self._change_month(1))
+        next_month_btn.bind(on_release=partial(self._change_month, 1))
         
         header.add_widget(prev_month_btn)
         header.add_widget(month_year_label)
@@ -75,9 +95,8 @@ class DatePickerPopup(Popup):
         left_panel.add_widget(header)
         
         # Day names header
-        day_names = ['Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So']
         day_header = GridLayout(cols=7, size_hint_y=None, height='40dp', spacing=2)
-        for day_name in day_names:
+        for day_name in self._DAY_NAMES:
             label = Label(
                 text=day_name,
                 font_size='18sp',
@@ -94,10 +113,24 @@ class DatePickerPopup(Popup):
             bar_width=10,
             size_hint_y=1
         )
-        days_grid = GridLayout(cols=7, spacing=3, size_hint_y=None)
+        days_grid = GridLayout(cols=7, rows=_CALENDAR_ROWS, spacing=3, size_hint_y=None)
         days_grid.bind(minimum_height=days_grid.setter('height'))
         self.days_grid = days_grid
-        self.day_buttons = []
+        # Fixed pool of one button per grid slot, created once and re-labelled per month
+        self._day_pool = []
+        for _ in range(_CALENDAR_SLOTS):
+            btn = DebouncedButton(font_size='18sp', size_hint_y=None, height='50dp')
+            btn._day = 0
+            btn.bind(on_release=self._on_day_btn)
+            days_grid.add_widget(btn)
+            self._day_pool.append(btn)
+        self.day_buttons = []  # Pool buttons showing days 1..n of the rendered month
+        # (year, month, today's day or -1) currently shown in days_grid; the picker lives
+        # as long as the app, so a date change past midnight must re-render the month
+        self._render_key = None
+        # Highlighted buttons of the rendered month, so a new selection only recolors two buttons
+        self._selected_btn = None
+        self._today_btn = None
         days_scroll.add_widget(days_grid)
         left_panel.add_widget(days_scroll)
         
@@ -157,13 +190,19 @@ class DatePickerPopup(Popup):
         self._update_calendar()
         self._update_selected_label()
     
-    def _get_month_name(self, month):
-        """Get German month name"""
-        months = ['', 'Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
-                  'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember']
-        return months[month]
+    def reset(self, current_date=None, on_select=None):
+        """Re-point a cached popup at a new date and callback without rebuilding widgets"""
+        if current_date is None:
+            current_date = datetime.date.today()
+        
+        self.on_select_callback = on_select
+        self.display_date = current_date
+        self.selected_day = current_date.day
+        self.month_year_label.text = f"{_GERMAN_MONTHS[current_date.month]} {current_date.year}"
+        self._update_calendar()
+        self._update_selected_label()
     
-    def _change_month(self, delta):
+    def _change_month(self, delta, *_):
         """Change displayed month"""
         year = self.display_date.year
         month = self.display_date.month + delta
@@ -176,7 +215,7 @@ class DatePickerPopup(Popup):
             year -= 1
         
         self.display_date = datetime.date(year, month, 1)
-        self.month_year_label.text = f"{self._get_month_name(month)} {year}"
+        self.month_year_label.text = f"{_GERMAN_MONTHS[month]} {year}"
         self._update_calendar()
     
     def _select_today(self):
@@ -184,100 +223,109 @@ class DatePickerPopup(Popup):
         today = datetime.date.today()
         self.display_date = today
         self.selected_day = today.day
-        self.month_year_label.text = f"{self._get_month_name(today.month)} {today.year}"
+        self.month_year_label.text = f"{_GERMAN_MONTHS[today.month]} {today.year}"
         self._update_calendar()
         self._update_selected_label()
     
     def _update_selected_label(self):
         """Update the label showing selected date"""
-        try:
-            date = datetime.date(
-                self.display_date.year,
-                self.display_date.month,
-                self.selected_day
-            )
-            self.selected_date_label.text = date.strftime("%d.%m.%Y")
-        except ValueError:
+        d, m, y = self.selected_day, self.display_date.month, self.display_date.year
+        # day_buttons holds one button per day of the displayed month (rendered first)
+        if 1 <= d <= len(self.day_buttons):
+            self.selected_date_label.text = f"{d:02d}.{m:02d}.{y:04d}"
+        else:
             self.selected_date_label.text = ""
     
+    def _get_today_day(self):
+        """Return today's day number if the displayed month contains today, else -1"""
+        today = datetime.date.today()
+        if today.year == self.display_date.year and today.month == self.display_date.month:
+            return today.day
+        return -1
+    
     def _update_calendar(self):
         """Update the calendar grid with days"""
-        self.days_grid.clear_widgets()
-        self.day_buttons = []
-        
-        first_day = datetime.date(self.display_date.year, self.display_date.month, 1)
-        first_weekday = first_day.weekday()
-        
-        if self.display_date.month == 12:
-            next_month = datetime.date(self.display_date.year + 1, 1, 1)
-        else:
-            next_month = datetime.date(self.display_date.year, self.display_date.month + 1, 1)
-        days_in_month = (next_month - first_day).days
+        ym = (self.display_date.year, self.display_date.month)
+        today_day = self._get_today_day()
+        render_key = (*ym, today_day)
+        if render_key == self._render_key:
+            # Month already built - only the highlighted day can have changed
+            self._update_day_colors()
+            return
+        self._render_key = render_key
         
-        # Add empty cells
-        for _ in range(first_weekday):
-            empty = Widget(size_hint_y=None, height='50dp')
-            self.days_grid.add_widget(empty)
+        self.day_buttons = []
+        self._selected_btn = None
+        self._today_btn = None
         
-        today = datetime.date.today()
-        for day in range(1, days_in_month + 1):
-            date = datetime.date(self.display_date.year, self.display_date.month, day)
-            is_today = (date == today)
+        pool = self._day_pool
+        slot = 0
+        for day in _CALENDAR.itermonthdays(*ym):
+            btn = pool[slot]
+            slot += 1
+            if day == 0:
+                # Padding cell before the 1st / after the last day
+                self._hide_day_slot(btn)
+                continue
+            
+            is_today = (day == today_day)
             is_selected = (day == self.selected_day)
             
             if is_selected:
-                bg_color = (0.2, 0.6, 0.9, 1)
-                text_color = (1, 1, 1, 1)
+                bg_color, text_color = _SELECTED_COLORS
             elif is_today:
-                bg_color = (0.3, 0.7, 0.3, 1)
-                text_color = (1, 1, 1, 1)
+                bg_color, text_color = _TODAY_COLORS
             else:
-                bg_color = (0.4, 0.4, 0.4, 1)
-                text_color = (1, 1, 1, 1)
+                bg_color, text_color = _DEFAULT_COLORS
             
-            btn = DebouncedButton(
-                text=str(day),
-                font_size='18sp',
-                size_hint_y=None,
-                height='50dp',
-                background_color=bg_color,
-                color=text_color
-            )
-            btn.bind(on_release=lambda instance, d=day: self._select_day(d))
-            self.days_grid.add_widget(btn)
+            btn.text = str(day)
+            btn.background_color = bg_color
+            btn.color = text_color
+            btn.opacity = 1
+            btn.disabled = False
+            btn._day = day
+            if is_selected:
+                self._selected_btn = btn
+            if is_today:
+                self._today_btn = btn
             self.day_buttons.append(btn)
         
-        # Fill remaining cells
-        total_cells = first_weekday + days_in_month
-        rows_needed = (total_cells + 6) // 7
-        total_slots = rows_needed * 7
-        
-        for _ in range(total_slots - total_cells):
-            empty = Widget(size_hint_y=None, height='50dp')
-            self.days_grid.add_widget(empty)
+        # Blank out the remaining slots of the fixed 6-week grid
+        for btn in pool[slot:]:
+            self._hide_day_slot(btn)
+    
+    @staticmethod
+    def _hide_day_slot(btn):
+        """Turn a pool button into an invisible, untappable padding cell"""
+        btn.text = ""
+        btn.opacity = 0
+        btn.disabled = True
+        btn._day = 0
+    
+    def _on_day_btn(self, btn):
+        """Shared on_release handler for all day buttons"""
+        self._select_day(btn._day)
     
     def _select_day(self, day):
         """Select a day"""
         self.selected_day = day
         self._update_selected_label()
+        self._update_day_colors()
+    
+    def _update_day_colors(self):
+        """Move the selection highlight, recoloring only the previous and new selected button"""
+        day = self.selected_day
+        new_btn = self.day_buttons[day - 1] if 1 <= day <= len(self.day_buttons) else None
+        old_btn = self._selected_btn
+        if new_btn is old_btn:
+            return
         
-        # Update button colors
-        today = datetime.date.today()
-        for i, btn in enumerate(self.day_buttons):
-            day_num = i + 1
-            date_check = datetime.date(self.display_date.year, self.display_date.month, day_num)
-            is_today = (date_check == today)
-            is_selected = (day_num == day)
-            
-            if is_selected:
-                btn.background_color = (0.2, 0.6, 0.9, 1)
-                btn.color = (1, 1, 1, 1)
-            elif is_today:
-                btn.background_color = (0.3, 0.7, 0.3, 1)
-                btn.color = (1, 1, 1, 1)
-            else:
-                btn.background_color = (0.4, 0.4, 0.4, 1)
-                btn.color = (1, 1, 1, 1)
+        if old_btn is not None:
+            colors = _TODAY_COLORS if old_btn is self._today_btn else _DEFAULT_COLORS
+            old_btn.background_color, old_btn.color = colors
+        if new_btn is not None:
+            new_btn.background_color, new_btn.color = _SELECTED_COLORS
+        self._selected_btn = new_btn
     
     def _confirm_date(self):
         """Confirm date selection"""
@@ -3,23 +3,140 @@ Entry editor popup for viewing and editing time entries.
 """
 import datetime
 import logging
+import sqlite3
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from kivy.uix.popup import Popup
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
-from kivy.uix.scrollview import ScrollView
 from kivy.uix.button import Button
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.properties import ListProperty, NumericProperty, ObjectProperty, StringProperty
 from kivy.app import App
 from kivy.clock import Clock
+from kivy.metrics import dp, sp
 from ..widgets import DebouncedButton
 from .limited_date_picker_popup import LimitedDatePickerPopup
 from .add_entry_popup import AddEntryPopup, EDIT_SESSIONS_LOOKBACK_DAYS
-from ...data.database import TimeEntry, db, ensure_db_connection, soft_delete_time_entries
+from ...data.database import (
+    TimeEntry, db, ensure_db_connection, soft_delete_time_entries, _get_employee_lock
+)
 
 logger = logging.getLogger(__name__)
 
+# Single worker thread for the editor's database writes so the UI stays responsive
+_db_executor = ThreadPoolExecutor(max_workers=1)
+
+# Entries fixed per UPDATE statement during recalculation; each one binds a single
+# id parameter, which keeps a batch under SQLite's classic 999-variable limit
+RECALC_UPDATE_BATCH_SIZE = 900
+
+# Database action values; indexed by the 1 (in) / 0 (out) encoding used while recalculating
+_ACTION_IN = 'in'
+_ACTION_OUT = 'out'
+_ACTIONS_BY_FLAG = (_ACTION_OUT, _ACTION_IN)
+
+# Realigns all of an employee's active entries to alternate IN/OUT from the first
+# entry's action in one statement, so deletes don't pull the whole history into
+# Python. Entries are numbered in (timestamp, id) order, which the (employee,
+# active, timestamp) index serves; only mismatching rows are written.
+# Window functions need SQLite 3.25+, UPDATE ... FROM 3.33+.
+_REALIGN_ACTIONS_SQL = f"""
+WITH seq AS (
+    SELECT id, action,
+           (ROW_NUMBER() OVER w - 1) % 2 AS odd,
+           FIRST_VALUE(action) OVER w = '{_ACTION_IN}' AS first_in
+    FROM {TimeEntry._meta.table_name}
+    WHERE employee_id = ? AND active = 1
+    WINDOW w AS (ORDER BY timestamp, id)
+)
+UPDATE {TimeEntry._meta.table_name}
+SET action = CASE WHEN seq.first_in <> seq.odd THEN '{_ACTION_IN}' ELSE '{_ACTION_OUT}' END
+FROM seq
+WHERE {TimeEntry._meta.table_name}.id = seq.id
+  AND seq.action <> CASE WHEN seq.first_in <> seq.odd THEN '{_ACTION_IN}' ELSE '{_ACTION_OUT}' END
+"""
+
+# Older SQLite builds (e.g. Raspberry Pi OS Buster ships 3.27) recalculate in Python
+# instead. SQLCipher links its own SQLite, so a failing statement falls back as well.
+_SQL_REALIGN_SUPPORTED = sqlite3.sqlite_version_info >= (3, 33)
+
+# Lightweight (id, timestamp, action) row of the employee's active entry sequence
+_EntryRow = namedtuple('_EntryRow', ('id', 'timestamp', 'action'))
+
+# Recycled row metrics, resolved once rather than parsing 'sp' strings per view
+_ROW_HEIGHT = dp(55)
+_ROW_LABEL_FONT = sp(16)
+_ROW_BUTTON_FONT = sp(14)
+
+
+def _day_bounds(d):
+    """Half-open [start, next midnight) datetime range of a date"""
+    # No sub-second edge at 23:59:59.999999
+    start_datetime = datetime.datetime.combine(d, datetime.time.min)
+    return start_datetime, start_datetime + datetime.timedelta(days=1)
+
+
+def _format_date(d):
+    """Format a date as DD.MM.YYYY (f-string, avoids strftime)"""
+    return f"{d.day:02d}.{d.month:02d}.{d.year:04d}"
+
+
+class EntryRow(RecycleDataViewBehavior, BoxLayout):
+    """Recycled entry list row: timestamp/action label and a delete button"""
+    entry_id = NumericProperty(0)
+    text = StringProperty("")
+    action_color = ListProperty([1, 1, 1, 1])
+    editor = ObjectProperty(None, allownone=True)
+    
+    def __init__(self, **kwargs):
+        kwargs.setdefault('spacing', 10)
+        kwargs.setdefault('padding', [5, 0, 5, 0])
+        super().__init__(**kwargs)
+        
+        label = Label(
+            text=self.text,
+            halign='left',
+            valign='middle',
+            text_size=(None, None),
+            size_hint_x=0.7,
+            color=self.action_color,
+            font_size=_ROW_LABEL_FONT,
+            bold=True
+        )
+        self.bind(text=label.setter('text'), action_color=label.setter('color'))
+        
+        # Delete button
+        delete_btn = DebouncedButton(
+            text="Delete",
+            size_hint_x=0.3,
+            background_color=(0.9, 0.2, 0.2, 1),
+            font_size=_ROW_BUTTON_FONT
+        )
+        delete_btn.bind(on_release=self._on_delete)
+        
+        self.add_widget(label)
+        self.add_widget(delete_btn)
+    
+    def _on_delete(self, *_):
+        if self.editor is not None:
+            self.editor._delete_entry_by_id(self.entry_id)
+
 
 class EntryEditorPopup(Popup):
+    # Row label colors per action
+    _COLOR_IN = (0.2, 0.8, 0.2, 1)
+    _COLOR_OUT = (0.8, 0.2, 0.2, 1)
+    # Row (text, color) per action, looked up instead of branching per row
+    _ACTION_DISPLAY = {
+        _ACTION_IN: ("IN", _COLOR_IN),
+        _ACTION_OUT: ("OUT", _COLOR_OUT),
+    }
+    
     def __init__(self, employee, on_deleted=None, **kwargs):
         super().__init__(
             title=f"Edit {employee.name} - Entries",
@@ -30,11 +147,24 @@ class EntryEditorPopup(Popup):
         self.employee = employee
         self.on_deleted = on_deleted
         self.entries = []
+        # Listed entries by id, for the recycled rows' delete dispatch
+        self._entries_by_id = {}
+        # Resolved once per popup (a new editor is opened for each edit session)
+        self._today = datetime.date.today()
         # Default to today; date selection allows configurable lookback.
-        self.selected_date = datetime.date.today()
+        self.selected_date = self._today
+        # Datetime range of selected_date, recomputed only when the date changes
+        self._day_range = _day_bounds(self.selected_date)
+        # Resolved once per popup; the lock serializes modifications of this employee's entries
+        self._employee_lock = _get_employee_lock(employee.id)
+        self._app = app = App.get_running_app()
+        # Child popups, created on first use and reused for the lifetime of the editor
+        self._date_picker = None
+        self._add_entry_popup = None
+        # Set while a delete/add is running on the worker thread
+        self._db_busy = False
         
         # Register with popup service for proper management
-        app = App.get_running_app()
         if app and hasattr(app, 'popup_service'):
             app.popup_service.close_main_popup()  # Close any existing main popup
             app.popup_service._register_popup(self, is_main=True)
@@ -42,33 +172,65 @@ class EntryEditorPopup(Popup):
         # Don't recalculate on open - only recalculate when entries are modified
         # This prevents actions from being incorrectly changed when just viewing entries
         # Recalculation happens automatically when entries are added or deleted
-        self._load_entries_for_date()
         self._build_ui()
         
         # Ensure proper cleanup on dismiss
         self.bind(on_dismiss=self._on_dismiss)
+        # Query and fill the list one frame after opening so the open animation isn't held up
+        self.bind(on_open=self._on_open)
+    
+    def _on_open(self, instance):
+        Clock.schedule_once(self._deferred_load, 0)
+    
+    def _deferred_load(self, dt):
+        """Load the selected day's entries and fill the list (scheduled from on_open)"""
+        self._rebuild_entries_list()
     
     def _on_dismiss(self, instance):
         """Cleanup when popup is dismissed"""
-        app = App.get_running_app()
+        app = self._app
         if app and hasattr(app, 'popup_service'):
             app.popup_service._unregister_popup(self)
     
-    def _load_entries_for_date(self):
-        """Load all time entries for the selected date (fresh from database)"""
-        ensure_db_connection()
-        start_datetime = datetime.datetime.combine(self.selected_date, datetime.time.min)
-        end_datetime = datetime.datetime.combine(self.selected_date, datetime.time.max)
+    def _load_entries_for_date(self, all_entries=None):
+        """
+        Load all time entries for the selected date (fresh from database).
         
-        # Query fresh from database to ensure we have the latest action values
-        self.entries = list(TimeEntry.select().where(
+        Args:
+            all_entries: Chronological (id, timestamp, action) rows of all the employee's
+                active entries, as recalculated by _recalculate_all_actions; when given, the
+                day is filtered from them instead of querying again
+        """
+        start_datetime, next_day = self._day_range
+        
+        if all_entries is not None:
+            self.entries = [e for e in all_entries if start_datetime <= e.timestamp < next_day]
+        else:
+            self.entries = self._query_day_entries(self._day_range)
+        self._entries_by_id = {entry.id: entry for entry in self.entries}
+        
+        logger.debug("[ENTRY_EDITOR] Loaded %d entries for %s", len(self.entries), self.selected_date)
+    
+    def _query_day_entries(self, day_range):
+        """
+        Chronological (id, timestamp, action) rows of a day's active entries.
+        
+        Args:
+            day_range: (start, next midnight) of the day; worker tasks pass the range
+                captured when they were submitted, since the user may change the date
+        """
+        start_datetime, next_day = day_range
+        ensure_db_connection()
+        # Query fresh from database to ensure we have the latest action values.
+        # Only the columns the rows and delete path use are fetched, as namedtuples.
+        return list(TimeEntry.select(
+            TimeEntry.id, TimeEntry.timestamp, TimeEntry.action
+        ).where(
             TimeEntry.employee == self.employee,
             TimeEntry.active == True,
             TimeEntry.timestamp >= start_datetime,
-            TimeEntry.timestamp <= end_datetime
-        ).order_by(TimeEntry.timestamp.asc()))
-        
-        logger.debug(f"[ENTRY_EDITOR] Loaded {len(self.entries)} entries for {self.selected_date}")
+            TimeEntry.timestamp < next_day
+        ).order_by(TimeEntry.timestamp.asc(), TimeEntry.id.asc()).namedtuples())
     
     def _build_ui(self):
         """Build the UI with all entries"""
@@ -79,12 +241,12 @@ class EntryEditorPopup(Popup):
         
         # Date selection button
         self.date_btn = DebouncedButton(
-            text=f"Datum: {self.selected_date.strftime('%d.%m.%Y')}",
+            text=f"Datum: {_format_date(self.selected_date)}",
             size_hint_x=0.6,
             font_size='20sp',
             background_color=(0.2, 0.6, 0.9, 1)
         )
-        self.date_btn.bind(on_release=lambda *_: self._pick_date())
+        self.date_btn.bind(on_release=self._pick_date)
         header_row.add_widget(self.date_btn)
         
         # Add Manual Entry button
@@ -94,7 +256,7 @@ class EntryEditorPopup(Popup):
             font_size='20sp',
             background_color=(0.2, 0.7, 1, 1)
         )
-        add_btn.bind(on_release=lambda *_: self._open_add_entry())
+        add_btn.bind(on_release=self._open_add_entry)
         header_row.add_widget(add_btn)
         
         layout.add_widget(header_row)
@@ -108,18 +270,27 @@ class EntryEditorPopup(Popup):
         )
         layout.add_widget(notice)
         
-        # Scrollable list of entries
-        scroll = ScrollView(do_scroll_x=False)
-        grid = GridLayout(cols=1, spacing=5, size_hint_y=None)
+        # Shown instead of the list when the selected day has no entries
+        # (and while the entries are loading right after opening)
+        self.no_entries_label = Label(text="Loading entries...", size_hint_y=None, height='40dp')
+        layout.add_widget(self.no_entries_label)
+        
+        # Scrollable list of entries; rows are recycled, so refreshing only swaps .data
+        scroll = RecycleView(viewclass=EntryRow, do_scroll_x=False)
+        grid = RecycleBoxLayout(
+            orientation='vertical',
+            spacing=5,
+            default_size=(None, _ROW_HEIGHT),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
         grid.bind(minimum_height=grid.setter('height'))
+        scroll.add_widget(grid)
         
         # Store references for rebuilding
         self.entries_scroll = scroll
         self.entries_grid = grid
         
-        self._populate_entries_grid()
-        
-        scroll.add_widget(grid)
         layout.add_widget(scroll)
         
         # Configure scroll behavior to prevent double-tap issues when content fits
@@ -132,257 +303,434 @@ class EntryEditorPopup(Popup):
             height='50dp',
             background_color=(0.3, 0.6, 0.9, 1)
         )
-        close_btn.bind(on_release=lambda *_: self.dismiss())
+        close_btn.bind(on_release=self.dismiss)
         layout.add_widget(close_btn)
         
         self.content = layout
     
-    def _create_entry_row(self, entry):
-        """Create a row widget for a single entry"""
-        row = BoxLayout(size_hint_y=None, height='55dp', spacing=10, padding=[5, 0, 5, 0])
-        
-        # Ensure we're reading the actual database value (refresh if needed)
-        # Reload the entry from database to ensure we have the latest action value
-        try:
-            fresh_entry = TimeEntry.get_by_id(entry.id)
-            entry.action = fresh_entry.action
-        except TimeEntry.DoesNotExist:
-            logger.warning(f"[ENTRY_EDITOR] Entry ID={entry.id} no longer exists")
+    def _entry_row_data(self, entry):
+        """Build the RecycleView data dict for a single entry"""
+        # Rows are always built right after _load_entries_for_date() (see
+        # _rebuild_entries_list), so entry.action is already the current database value
+        action_text, action_color = self._ACTION_DISPLAY.get(entry.action, self._ACTION_DISPLAY[_ACTION_OUT])
         
-        # Timestamp and action label - display the actual database value
-        action_color = (0.2, 0.8, 0.2, 1) if entry.action == 'in' else (0.8, 0.2, 0.2, 1)
-        action_text = "IN" if entry.action == 'in' else "OUT"
-        logger.debug(f"[ENTRY_EDITOR] Displaying entry ID={entry.id}: {entry.timestamp} - {entry.action.upper()}")
-        
-        label = Label(
-            text=f"{entry.timestamp.strftime('%H:%M:%S')} - {action_text}",
-            halign='left',
-            valign='middle',
-            text_size=(None, None),
-            size_hint_x=0.7,
-            color=action_color,
-            font_size='16sp',
-            bold=True
-        )
-        
-        # Delete button
-        delete_btn = DebouncedButton(
-            text="Delete",
-            size_hint_x=0.3,
-            background_color=(0.9, 0.2, 0.2, 1),
-            font_size='14sp'
-        )
-        delete_btn.bind(on_release=lambda inst, e=entry: self._delete_entry(e))
-        
-        row.add_widget(label)
-        row.add_widget(delete_btn)
-        return row
+        ts = entry.timestamp
+        return {
+            'entry_id': entry.id,
+            'text': f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d} - {action_text}",
+            'action_color': action_color,
+            'editor': self,
+        }
+    
+    def _delete_entry_by_id(self, entry_id):
+        """Delete handler for recycled rows, which only carry the entry id"""
+        entry = self._entries_by_id.get(entry_id)
+        if entry is None:
+            logger.warning(f"[ENTRY_EDITOR] Entry ID={entry_id} is no longer listed")
+            return
+        self._delete_entry(entry)
     
     def _delete_entry(self, entry):
         """Delete a single entry and update subsequent actions with proper transaction handling and employee-level locking"""
-        from ...data.database import _get_employee_lock
+        logger.debug("[ENTRY_EDITOR] Deleting entry ID=%s, action=%s, time=%s", entry.id, entry.action, entry.timestamp)
+        self._delete_entries([entry])
+    
+    def _delete_entries(self, entries):
+        """Delete listed entries with a single soft-delete and at most one recalculation"""
+        deleted_ids = {entry.id for entry in entries}
+        # The rest of the day, in case no recalculation turns out to be needed
+        remaining = [e for e in self.entries if e.id not in deleted_ids]
+        self._submit_db_task(
+            partial(
+                self._delete_entries_task,
+                list(deleted_ids),
+                min(entry.timestamp for entry in entries),
+                remaining,
+                self._day_range
+            ),
+            partial(self._on_entry_deleted, self._day_range),
+            "Error deleting entry",
+            "Fehler beim Löschen"
+        )
+    
+    def _delete_entries_task(self, entry_ids, earliest_timestamp, remaining, day_range):
+        """
+        Soft-delete entries and fix the actions after them (runs on the worker thread).
         
-        logger.debug(f"[ENTRY_EDITOR] Deleting entry ID={entry.id}, action={entry.action}, time={entry.timestamp}")
+        Args:
+            entry_ids: Ids of the entries to delete
+            earliest_timestamp: Timestamp of the earliest of those entries
+            remaining: The listed day's rows without the deleted entries
+            day_range: Range of the day listed when the delete was submitted
         
+        Returns:
+            Rows covering that day, for _rebuild_entries_list
+        """
         # Acquire employee-specific lock to prevent concurrent modifications
-        employee_lock = _get_employee_lock(self.employee.id)
-        
-        with employee_lock:
-            try:
-                ensure_db_connection()
-                
-                # Soft delete the entry (soft_delete_time_entries has its own transaction)
-                soft_delete_time_entries([entry.id])
-                
-                logger.info(f"[ENTRY_EDITOR] Deleted entry ID={entry.id}")
-                
-                # Recalculate all actions for all active entries
-                self._recalculate_all_actions()
-                
-                # Reload entries and inform user (same pattern as _save_manual_entry)
-                self._load_entries_for_date()
-                self._rebuild_entries_list()
-                
-                # Call on_deleted callback if provided
-                if self.on_deleted:
-                    self.on_deleted()
+        with self._employee_lock:
+            ensure_db_connection()
+            
+            # Delete and recalculate in one transaction, so a delete commits only once
+            with db.atomic('IMMEDIATE'):
+                # Soft delete with a single UPDATE ... WHERE id IN (...)
+                soft_delete_time_entries(entry_ids)
                 
-                # Show success message (stay in editor like add does)
-                App.get_running_app().show_popup("Erfolg", "Eintrag erfolgreich gelöscht")
+                logger.info(f"[ENTRY_EDITOR] Deleted entries IDs={entry_ids}")
                 
-            except Exception as e:
-                logger.error(f"[ENTRY_EDITOR] Error deleting entry: {e}")
-                App.get_running_app().show_popup("Error", f"Fehler beim Löschen: {str(e)}")
+                if self._has_later_entries(earliest_timestamp):
+                    # Realign the actions of all later entries; only the selected day
+                    # is read back afterwards (below)
+                    self._realign_actions()
+                    all_entries = None
+                else:
+                    # Dropping the tail of the sequence can't break the alternation, so
+                    # skip the full recalculation; the rest of the day is unchanged
+                    logger.debug("[ENTRY_EDITOR] Deleted the latest entries, nothing to recalculate")
+                    all_entries = remaining
+            
+            if all_entries is None:
+                # Show the day as it is in the database now
+                all_entries = self._query_day_entries(day_range)
+        return all_entries
+    
+    def _on_entry_deleted(self, day_range, all_entries):
+        """Refresh the list after a delete and inform the user (runs on the UI thread)"""
+        # Reload entries (filtered from the recalculated rows), same pattern as adding
+        self._rebuild_after_task(day_range, all_entries)
+        
+        # Call on_deleted callback if provided
+        if self.on_deleted:
+            self.on_deleted()
+        
+        # Show success message (stay in editor like add does)
+        self._app.show_popup("Erfolg", "Eintrag erfolgreich gelöscht")
+    
+    def _submit_db_task(self, task, on_success, log_message, error_message):
+        """
+        Run a database write on the worker thread and hand its result back to the UI thread.
+        
+        Args:
+            task: Callable doing the blocking DB work
+            on_success: Called with the task result on the UI thread
+            log_message: Prefix for the log entry on failure
+            error_message: Prefix for the error popup on failure
+        """
+        if self._db_busy:
+            # The list is about to change; a second edit would act on stale rows
+            self._app.show_popup("Bitte warten", "Die vorherige Änderung wird noch gespeichert.")
+            return
+        self._db_busy = True
+        
+        future = _db_executor.submit(task)
+        future.add_done_callback(
+            lambda fut: Clock.schedule_once(
+                lambda dt: self._on_db_task_done(fut, on_success, log_message, error_message), 0
+            )
+        )
+    
+    def _on_db_task_done(self, future, on_success, log_message, error_message):
+        """Dispatch a finished database task (runs on the UI thread)"""
+        self._db_busy = False
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"[ENTRY_EDITOR] {log_message}: {e}")
+            self._app.show_popup("Error", f"{error_message}: {str(e)}")
+            return
+        on_success(result)
 
+    def _has_later_entries(self, timestamp):
+        """Whether any active entry of the employee is at or after the given timestamp"""
+        # Same-timestamp entries count as later, since their order isn't defined
+        return TimeEntry.select(TimeEntry.id).where(
+            TimeEntry.employee == self.employee,
+            TimeEntry.active == True,
+            TimeEntry.timestamp >= timestamp
+        ).exists()
+    
     def _populate_entries_grid(self):
         """Populate the entries grid with current entries"""
-        self.entries_grid.clear_widgets()
+        label = self.no_entries_label
         if not self.entries:
-            date_str = "today" if self.selected_date == datetime.date.today() else self.selected_date.strftime('%d.%m.%Y')
-            no_entries = Label(
-                text=f"No entries found for {date_str}.",
-                size_hint_y=None,
-                height='40dp'
-            )
-            self.entries_grid.add_widget(no_entries)
+            date_str = "today" if self.selected_date == self._today else _format_date(self.selected_date)
+            label.text = f"No entries found for {date_str}."
+            label.height = dp(40)
+            label.opacity = 1
         else:
-            for entry in self.entries:
-                row = self._create_entry_row(entry)
-                self.entries_grid.add_widget(row)
+            label.text = ""
+            label.height = 0
+            label.opacity = 0
+        # RecycleView reuses its row widgets; only the visible rows are refreshed
+        self._apply_row_data([self._entry_row_data(entry) for entry in self.entries])
+    
+    def _apply_row_data(self, data):
+        """Bring the RecycleView data in line with the new rows, touching only what changed"""
+        current = self.entries_scroll.data
+        if len(data) == len(current) - 1:
+            # A single deleted row: drop just that item before comparing the rest
+            for i, (old_row, new_row) in enumerate(zip(current, data)):
+                if old_row['entry_id'] != new_row['entry_id']:
+                    break
+            else:
+                i = len(data)
+            del current[i]
+        if [row['entry_id'] for row in current] != [row['entry_id'] for row in data]:
+            self.entries_scroll.data = data
+            return
+        # Same rows (e.g. actions flipped by a recalculation): replace only changed items
+        for i, new_row in enumerate(data):
+            if current[i] != new_row:
+                current[i] = new_row
     
-    def _rebuild_entries_list(self):
-        """Rebuild the entries list after changes"""
+    def _rebuild_entries_list(self, all_entries=None):
+        """Reload the selected day's entries and rebuild the list after changes"""
+        # The only place rows are (re)loaded, so what's shown is always a fresh snapshot
+        self._load_entries_for_date(all_entries)
         self._populate_entries_grid()
     
-    def _pick_date(self):
+    def _rebuild_after_task(self, day_range, all_entries):
+        """Rebuild the list from a worker task's rows, unless the date changed meanwhile"""
+        if day_range != self._day_range:
+            # The rows may only cover the previously selected day; reload this one
+            logger.debug("[ENTRY_EDITOR] Date changed during the database task, reloading")
+            all_entries = None
+        self._rebuild_entries_list(all_entries)
+    
+    def _pick_date(self, *_):
         """Open date picker limited to the configured edit lookback window."""
-        today = datetime.date.today()
+        today = self._today
         min_date = today - datetime.timedelta(days=EDIT_SESSIONS_LOOKBACK_DAYS)
         
-        LimitedDatePickerPopup(
-            current_date=self.selected_date,
-            min_date=min_date,
-            max_date=today,
-            on_select=self._set_date
-        ).open()
+        if self._date_picker is None:
+            self._date_picker = LimitedDatePickerPopup(
+                current_date=self.selected_date,
+                min_date=min_date,
+                max_date=today,
+                on_select=self._set_date
+            )
+        else:
+            self._date_picker.reset(self.selected_date, min_date, today, on_select=self._set_date)
+        self._date_picker.open()
     
     def _set_date(self, date_obj):
         """Update selected date and reload entries"""
         if date_obj != self.selected_date:
             self.selected_date = date_obj
-            self.date_btn.text = f"Datum: {self.selected_date.strftime('%d.%m.%Y')}"
-            self._load_entries_for_date()
+            self._day_range = _day_bounds(date_obj)
+            self.date_btn.text = f"Datum: {_format_date(self.selected_date)}"
             self._rebuild_entries_list()
     
-    def _open_add_entry(self):
+    def _open_add_entry(self, *_):
         """Open popup to add a manual entry"""
         # Pre-select the date in the add entry popup
-        AddEntryPopup(
-            employee=self.employee,
-            initial_date=self.selected_date,
-            on_save=self._save_manual_entry
-        ).open()
+        if self._add_entry_popup is None:
+            self._add_entry_popup = AddEntryPopup(
+                employee=self.employee,
+                initial_date=self.selected_date,
+                on_save=self._save_manual_entry
+            )
+        else:
+            self._add_entry_popup.reset(self.selected_date, on_save=self._save_manual_entry)
+        self._add_entry_popup.open()
 
     def _save_manual_entry(self, action, timestamp):
         """Persist manual entry and refresh state with validation and employee-level locking"""
-        from ...data.database import _get_employee_lock
+        # Checks that don't depend on database state run before taking the lock
+        try:
+            self._validate_manual_entry(timestamp)
+        except ValueError as e:
+            logger.error(f"[ENTRY_EDITOR] Validation error adding manual entry: {e}")
+            self._app.show_popup("Error", f"Validierungsfehler: {str(e)}")
+            return
         
-        # Acquire employee-specific lock to prevent concurrent modifications
-        employee_lock = _get_employee_lock(self.employee.id)
+        self._submit_db_task(
+            partial(self._save_manual_entry_task, action, timestamp, self._day_range),
+            partial(self._on_manual_entry_saved, self._day_range),
+            "Error adding manual entry",
+            "Fehler beim Hinzufügen"
+        )
+    
+    def _save_manual_entry_task(self, action, timestamp, day_range):
+        """
+        Insert a manual entry and fix the actions around it (runs on the worker thread).
         
-        with employee_lock:
-            try:
-                ensure_db_connection()
-                
-                # Re-validate action against current database state before saving
-                last_entry = TimeEntry.get_last_before_timestamp(self.employee, timestamp)
+        Args:
+            action: Requested action, re-validated against the database
+            timestamp: Timestamp of the new entry
+            day_range: Range of the day listed when the entry was submitted
+        
+        Returns:
+            (saved action, rows covering that day) tuple
+        """
+        # Acquire employee-specific lock to prevent concurrent modifications
+        with self._employee_lock:
+            ensure_db_connection()
+            
+            # Validate, insert and recalculate in one transaction (write lock taken
+            # up front) against a single read of the employee's entry sequence
+            with db.atomic('IMMEDIATE'):
+                rows = self._fetch_active_rows()
+                timestamps = [row.timestamp for row in rows]
                 
-                # Determine what action should be based on current database state
-                if not last_entry or last_entry.action == 'out':
-                    expected_action = 'in'
+                # Re-validate action against current database state: the entry
+                # follows the last one strictly before its timestamp
+                before = bisect_left(timestamps, timestamp)
+                if not before or rows[before - 1].action == _ACTION_OUT:
+                    expected_action = _ACTION_IN
                 else:
-                    expected_action = 'out'
+                    expected_action = _ACTION_OUT
                 
                 # If provided action doesn't match expected, use expected action
                 if action != expected_action:
                     logger.warning(f"[ENTRY_EDITOR] Action mismatch: provided '{action}', expected '{expected_action}'. Using expected.")
                     action = expected_action
                 
-                # Validate timestamp is reasonable
-                now = datetime.datetime.now()
-                max_future = now + datetime.timedelta(days=1)
-                min_past = now - datetime.timedelta(days=365)
-                
-                if timestamp > max_future:
-                    raise ValueError(f"Timestamp cannot be more than 1 day in the future.")
-                if timestamp < min_past:
-                    raise ValueError(f"Timestamp cannot be more than 1 year in the past.")
-                
-                if action not in ('in', 'out'):
-                    raise ValueError(f"Invalid action: {action}")
-                
-                if not self.employee.active:
-                    raise ValueError("Cannot create time entry for inactive employee")
+                entry = TimeEntry.create(
+                    employee=self.employee,
+                    timestamp=timestamp,
+                    action=action,
+                    active=True
+                )
                 
-                # Create entry within transaction
-                with db.atomic():
-                    entry = TimeEntry.create(
-                        employee=self.employee,
-                        timestamp=timestamp,
-                        action=action,
-                        active=True
-                    )
-                logger.info(f"[ENTRY_EDITOR] Added manual entry {action} at {timestamp}")
-                
-                # Recalculate all actions for all active entries
-                self._recalculate_all_actions()
-                
-                # Reload entries and inform user
-                self._load_entries_for_date()
-                self._rebuild_entries_list()
-                app = App.get_running_app()
-                app.show_popup("Erfolg", f"Manueller Eintrag ({action.upper()}) gespeichert.")
-            except ValueError as e:
-                logger.error(f"[ENTRY_EDITOR] Validation error adding manual entry: {e}")
-                App.get_running_app().show_popup("Error", f"Validierungsfehler: {str(e)}")
+                # Recalculate all actions on the sequence with the new entry placed
+                # where the database orders it (after entries with the same timestamp)
+                rows.insert(bisect_right(timestamps, timestamp), _EntryRow(entry.id, timestamp, action))
+                all_entries = self._recalculate_all_actions(rows)
+            logger.info(f"[ENTRY_EDITOR] Added manual entry {action} at {timestamp}")
+            
+            if all_entries is None:
+                # Recalculation failed; show the day as it is in the database now
+                all_entries = self._query_day_entries(day_range)
+        return action, all_entries
+    
+    def _on_manual_entry_saved(self, day_range, result):
+        """Refresh the list after adding an entry and inform the user (runs on the UI thread)"""
+        action, all_entries = result
+        # Reload entries (filtered from the recalculated rows) and inform user
+        self._rebuild_after_task(day_range, all_entries)
+        self._app.show_popup("Erfolg", f"Manueller Eintrag ({action.upper()}) gespeichert.")
+    
+    def _validate_manual_entry(self, timestamp):
+        """Validate a manual entry independently of database state; raises ValueError"""
+        # Validate timestamp is reasonable
+        now = datetime.datetime.now()
+        max_future = now + datetime.timedelta(days=1)
+        min_past = now - datetime.timedelta(days=365)
+        
+        if timestamp > max_future:
+            raise ValueError(f"Timestamp cannot be more than 1 day in the future.")
+        if timestamp < min_past:
+            raise ValueError(f"Timestamp cannot be more than 1 year in the past.")
+        
+        if not self.employee.active:
+            raise ValueError("Cannot create time entry for inactive employee")
+    
+    def _fetch_active_rows(self):
+        """Chronological (id, timestamp, action) rows of all the employee's active entries"""
+        # Plain namedtuples skip model hydration; the (employee, active, timestamp)
+        # index serves the filter and the ordering.
+        return list(TimeEntry.select(TimeEntry.id, TimeEntry.timestamp, TimeEntry.action).where(
+            TimeEntry.employee == self.employee,
+            TimeEntry.active == True
+        ).order_by(TimeEntry.timestamp.asc(), TimeEntry.id.asc()).objects(_EntryRow))
+    
+    def _realign_actions(self):
+        """
+        Fix the IN/OUT alternation of all active entries for callers that don't hold
+        the rows: inside SQLite where supported, otherwise by fetching and recalculating.
+        """
+        if _SQL_REALIGN_SUPPORTED:
+            try:
+                self._realign_actions_in_db()
+                return
             except Exception as e:
-                logger.error(f"[ENTRY_EDITOR] Error adding manual entry: {e}")
-                App.get_running_app().show_popup("Error", f"Fehler beim Hinzufügen: {str(e)}")
+                logger.warning(f"[ENTRY_EDITOR] Realigning actions in SQLite failed, recalculating in Python: {e}")
+        self._recalculate_all_actions(self._fetch_active_rows())
     
-    def _recalculate_all_actions(self):
+    def _realign_actions_in_db(self):
+        """
+        Recalculate actions for all active entries for this employee inside the database.
+        Same IN/OUT alternation as _recalculate_all_actions.
+        
+        Returns:
+            Number of entries whose action was changed
+        
+        Raises:
+            Exception: If the statement fails (its changes are rolled back)
+        """
+        # Savepoint, so a failing statement leaves the caller's transaction usable
+        with db.atomic():
+            db.execute_sql(_REALIGN_ACTIONS_SQL, (self.employee.id,))
+            # cursor.rowcount isn't reliable for statements starting with WITH
+            updates_made = db.execute_sql("SELECT changes()").fetchone()[0]
+        
+        if updates_made > 0:
+            logger.info(f"[ENTRY_EDITOR] Recalculated {updates_made} entries to ensure proper IN/OUT alternation")
+        else:
+            logger.debug("[ENTRY_EDITOR] Actions already form valid pattern")
+        return updates_made
+    
+    def _recalculate_all_actions(self, rows):
         """
         Recalculate actions for all active entries for this employee in chronological order.
         Ensures proper IN/OUT alternation pattern starting from the first entry.
+        
+        Args:
+            rows: Current chronological (id, timestamp, action) rows of all active
+                entries (modified in place)
+        
+        Returns:
+            Chronological (id, timestamp, action) rows of all active entries with the
+            recalculated actions applied, or None if recalculation failed
         """
         try:
-            ensure_db_connection()
+            # Zero or one entry can't break the alternation
+            if len(rows) < 2:
+                logger.debug("[ENTRY_EDITOR] %d active entries, nothing to recalculate", len(rows))
+                return rows
             
-            # Get all active entries for this employee, ordered chronologically
-            all_entries = list(TimeEntry.select().where(
-                TimeEntry.employee == self.employee,
-                TimeEntry.active == True
-            ).order_by(TimeEntry.timestamp.asc()))
+            # Expected actions: preserve first entry's action, then alternate. A sequence
+            # that already alternates matches everywhere, so one pass both validates and
+            # collects fixes. Actions are encoded once as 1 (in) / 0 (out), so the scan
+            # compares small ints and the expected value just toggles.
+            flags = bytes(row[2] == _ACTION_IN for row in rows)
+            expected = flags[0]
             
-            if not all_entries:
-                logger.debug("[ENTRY_EDITOR] No active entries to recalculate")
-                return
-            
-            # Check if actions form a valid pattern (alternating in/out)
-            needs_recalculation = False
-            for i in range(1, len(all_entries)):
-                if all_entries[i].action == all_entries[i-1].action:
-                    needs_recalculation = True
-                    logger.debug(f"[ENTRY_EDITOR] Found consecutive {all_entries[i].action.upper()} actions at index {i}, recalculation needed")
-                    break
+            # Collect the ids of mismatching entries, grouped by the flag they should get
+            # (rows are only touched when fixed)
+            fix_ids = ([], [])
+            for i, flag in enumerate(flags):
+                if flag != expected:
+                    row = rows[i]
+                    expected_action = _ACTIONS_BY_FLAG[expected]
+                    logger.debug("[ENTRY_EDITOR] Updating entry ID=%s from %s to %s", row.id, row.action, expected_action)
+                    fix_ids[expected].append(row.id)
+                    rows[i] = row._replace(action=expected_action)
+                expected ^= 1
+            updates_made = len(fix_ids[0]) + len(fix_ids[1])
             
             # If actions already form a valid pattern, don't change them
-            if not needs_recalculation:
-                logger.debug(f"[ENTRY_EDITOR] Actions already form valid pattern for {len(all_entries)} entries")
-                return
-            
-            # Calculate expected actions: preserve first entry's action, then alternate
-            first_action = all_entries[0].action
-            expected_actions = [first_action]
-            for i in range(1, len(all_entries)):
-                prev = expected_actions[i-1]
-                expected_actions.append('out' if prev == 'in' else 'in')
+            if not updates_made:
+                logger.debug("[ENTRY_EDITOR] Actions already form valid pattern for %d entries", len(rows))
+                return rows
             
-            # Update all entries that don't match expected action
-            updates_made = 0
+            # One UPDATE ... SET action = ? WHERE id IN (...) per target action (and batch)
             with db.atomic():
-                for entry, expected_action in zip(all_entries, expected_actions):
-                    if entry.action != expected_action:
-                        TimeEntry.update(action=expected_action).where(TimeEntry.id == entry.id).execute()
-                        logger.debug(f"[ENTRY_EDITOR] Updated entry ID={entry.id} from {entry.action} to {expected_action}")
-                        updates_made += 1
-                        entry.action = expected_action
+                for flag, ids in enumerate(fix_ids):
+                    for start in range(0, len(ids), RECALC_UPDATE_BATCH_SIZE):
+                        TimeEntry.update(action=_ACTIONS_BY_FLAG[flag]).where(
+                            TimeEntry.id.in_(ids[start:start + RECALC_UPDATE_BATCH_SIZE])
+                        ).execute()
             
             if updates_made > 0:
                 logger.info(f"[ENTRY_EDITOR] Recalculated {updates_made} entries to ensure proper IN/OUT alternation")
+            return rows
             
         except Exception as e:
             logger.error(f"[ENTRY_EDITOR] Error recalculating actions: {e}")
             # Don't raise - allow operation to continue even if recalculation fails
+            # (callers then reload from the database)
+            return None
 
     def _configure_scroll_behavior(self, scroll_view, grid):
         """Disable scrolling when the grid fits to avoid touch interception (prevents double-tap issue)."""
@@ -2,16 +2,43 @@
 Greeter popup for welcoming employees on clock in/out.
 """
 import os
-import time
+import zlib
 import random
 import datetime
 import logging
+from functools import lru_cache
 from kivy.uix.popup import Popup
 from kivy.properties import StringProperty, ObjectProperty
 from kivy.clock import Clock
 
 logger = logging.getLogger(__name__)
 
+# Greeting files live in src/data/greetings
+_GREETINGS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'greetings'
+)
+
+# Section headers (emojis) and time range comments in the greeting files
+_GREETING_SKIP_PREFIXES = ('🌅', '☀️', '🌙', '(', 'ca.')
+
+
+@lru_cache(maxsize=64)
+def _load_greeting_lines(filename):
+    """
+    Read the usable greeting lines of a file once; greeting files are static assets.
+    
+    Returns:
+        Tuple of stripped lines, empty if the file doesn't exist
+    """
+    if not os.path.exists(filename):
+        return ()
+    with open(filename, 'r', encoding='utf-8') as f:
+        # Filter out empty lines, section headers, and comments
+        return tuple(
+            stripped for stripped in (line.strip() for line in f)
+            if stripped and not stripped.startswith(_GREETING_SKIP_PREFIXES)
+        )
+
 
 class GreeterPopup(Popup):
     """Popup that displays friendly greeting messages"""
@@ -23,20 +50,29 @@ class GreeterPopup(Popup):
     # Available languages: 'ch' (Schweizerdeutsch), 'de' (Deutsch), 'it' (Italienisch), 'rm' (Rätoromanisch)
     AVAILABLE_LANGUAGES = ['ch', 'de', 'it', 'rm']
     
-    def __init__(self, employee, action, **kwargs):
+    def __init__(self, employee=None, action=None, **kwargs):
         super().__init__(**kwargs)
         self.title = ""
         self.separator_height = 0
         self.size_hint = (0.8, 0.6)
         self.auto_dismiss = True
+        self._dismiss_trigger = Clock.create_trigger(self.dismiss, 8)
         
+        if employee is not None:
+            self.set_content(employee, action)
+    
+    def set_content(self, employee, action):
+        """Fill in the greeting for an employee and restart the auto-dismiss countdown"""
         name = employee.name.split()[0]  # First name
         
+        # Read the clock once so shift and language agree on the time
+        now = datetime.datetime.now()
+        
         # Determine shift based on current time
-        shift = self._get_shift()
+        shift = self._get_shift(now)
         
-        # Select language based on entropy (tag_id, time, employee_id, cpu_temp)
-        language = self._select_language(employee)
+        # Select language based on entropy (tag_id, employee_id, time)
+        language = self._select_language(employee, now)
         
         # Build filename based on action, shift, and language
         filename = self._get_greeting_filename(action, shift, language)
@@ -49,12 +85,16 @@ class GreeterPopup(Popup):
             self.greeting = f"Tschüss, {name}!"
             self.message = self._get_random_message(filename, "Schönen Feierabend!", name)
             self.color_theme = (1, 0.6, 0, 1)  # Orange
-            
-        Clock.schedule_once(self.dismiss, 8)
+        
+        self._dismiss_trigger.cancel()
+        self._dismiss_trigger()
+    
+    def on_dismiss(self):
+        """Stop a pending auto-dismiss so it can't close the popup when reused"""
+        self._dismiss_trigger.cancel()
 
-    def _get_shift(self):
-        """Determine current shift based on time of day"""
-        now = datetime.datetime.now()
+    def _get_shift(self, now):
+        """Determine the shift of the given time of day"""
         hour = now.hour
         
         # Morning shift: 04:00 - 11:00
@@ -70,104 +110,61 @@ class GreeterPopup(Popup):
         else:
             return 'midday'
     
-    def _select_language(self, employee):
-        """Select language randomly based on entropy from tag_id, time, employee_id, and cpu_temp"""
+    def _select_language(self, employee, now):
+        """Select language based on a stable hash of tag_id, employee_id and time of day"""
         try:
             # Get tag ID (RFID tag)
             tag_id = employee.rfid_tag if hasattr(employee, 'rfid_tag') else ''
             
             # Get current time components for entropy
-            now = datetime.datetime.now()
             time_hash = now.hour * 3600 + now.minute * 60 + now.second
             
             # Get employee ID
             employee_id = employee.id if hasattr(employee, 'id') else 0
             
-            # Get CPU temperature (Raspberry Pi)
-            cpu_temp = self._get_cpu_temperature()
-            
-            # Combine all entropy sources
-            entropy_string = f"{tag_id}{time_hash}{employee_id}{cpu_temp}"
-            
-            # Create hash from combined string
-            entropy_hash = hash(entropy_string)
+            # Stable checksum of the combined sources; builtin hash() of a str is
+            # salted per process (PYTHONHASHSEED), so it isn't reproducible across restarts
+            entropy_hash = zlib.adler32(f"{tag_id}|{employee_id}|{time_hash}".encode())
             
             # Use hash to select language deterministically
-            language_index = abs(entropy_hash) % len(self.AVAILABLE_LANGUAGES)
+            language_index = entropy_hash % len(self.AVAILABLE_LANGUAGES)
             selected_language = self.AVAILABLE_LANGUAGES[language_index]
             
-            logger.debug(f"Language selection: tag={tag_id}, time={time_hash}, emp_id={employee_id}, temp={cpu_temp}, hash={entropy_hash}, lang={selected_language}")
+            logger.debug("Language selection: tag=%s, time=%s, emp_id=%s, hash=%s, lang=%s",
+                         tag_id, time_hash, employee_id, entropy_hash, selected_language)
             
             return selected_language
         except Exception as e:
             logger.warning(f"Error selecting language, using default 'rm': {e}")
             return 'rm'  # Default fallback
     
-    def _get_cpu_temperature(self):
-        """Read CPU temperature from Raspberry Pi thermal zone"""
-        try:
-            # Try Raspberry Pi thermal zone
-            temp_path = '/sys/class/thermal/thermal_zone0/temp'
-            if os.path.exists(temp_path):
-                with open(temp_path, 'r') as f:
-                    temp_millidegrees = int(f.read().strip())
-                    return temp_millidegrees // 1000  # Convert to degrees Celsius
-        except Exception as e:
-            logger.debug(f"Could not read CPU temperature: {e}")
-        
-        # Fallback: use current time in seconds as pseudo-temperature
-        return int(time.time()) % 100
-    
     def _get_greeting_filename(self, action, shift, language):
         """Build filename based on action, shift, and language"""
         action_part = 'in' if action == 'in' else 'out'
-        # Get path relative to src directory
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        return os.path.join(base_path, 'data', 'greetings', f'greetings_{action_part}_{shift}_{language}.txt')
+        return os.path.join(_GREETINGS_DIR, f'greetings_{action_part}_{shift}_{language}.txt')
 
     def _get_random_message(self, filename, default_msg, employee_name):
         """Load a random message from a file, replace [Name] placeholder, or return default if failed"""
-        # Try specific shift file first
-        try:
-            if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    # Filter out empty lines, section headers, and comments
-                    lines = []
-                    for line in f:
-                        stripped = line.strip()
-                        # Skip empty lines, section headers (emojis), and time range comments
-                        if stripped and not stripped.startswith('🌅') and not stripped.startswith('☀️') and not stripped.startswith('🌙') and not stripped.startswith('(') and not stripped.startswith('ca.'):
-                            lines.append(stripped)
-                    if lines:
-                        message = random.choice(lines)
-                        # Replace [Name] placeholder with actual employee name
-                        message = message.replace('[Name]', employee_name)
-                        # Convert literal \n strings to actual newlines
-                        message = message.replace('\\n', '\n')
-                        return message
-        except Exception as e:
-            logger.warning(f"Error loading greeting from {filename}: {e}")
-        
-        # Fallback to general greeting files if specific shift file not found
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        fallback_file = os.path.join(base_path, 'data', 'greetings', 'greetings_in.txt' if 'in' in filename else 'greetings_out.txt')
-        try:
-            if os.path.exists(fallback_file):
-                with open(fallback_file, 'r', encoding='utf-8') as f:
-                    lines = []
-                    for line in f:
-                        stripped = line.strip()
-                        if stripped and not stripped.startswith('🌅') and not stripped.startswith('☀️') and not stripped.startswith('🌙') and not stripped.startswith('(') and not stripped.startswith('ca.'):
-                            lines.append(stripped)
-                    if lines:
-                        message = random.choice(lines)
-                        message = message.replace('[Name]', employee_name)
-                        # Convert literal \n strings to actual newlines
-                        message = message.replace('\\n', '\n')
-                        return message
-        except Exception as e:
-            logger.warning(f"Error loading fallback greeting from {fallback_file}: {e}")
+        # Try specific shift file first, then fall back to the general greeting file
+        lines = self._read_greeting_lines(filename)
+        if not lines:
+            fallback_file = os.path.join(_GREETINGS_DIR, 'greetings_in.txt' if 'in' in filename else 'greetings_out.txt')
+            lines = self._read_greeting_lines(fallback_file)
+        if lines:
+            message = random.choice(lines)
+            # Replace [Name] placeholder with actual employee name
+            message = message.replace('[Name]', employee_name)
+            # Convert literal \n strings to actual newlines
+            message = message.replace('\\n', '\n')
+            return message
         
         # Replace [Name] in default message too
         return default_msg.replace('[Name]', employee_name) if '[Name]' in default_msg else default_msg
 
+    def _read_greeting_lines(self, filename):
+        """Cached greeting lines of a file; empty if it is missing or unreadable"""
+        try:
+            return _load_greeting_lines(filename)
+        except Exception as e:
+            logger.warning(f"Error loading greeting from {filename}: {e}")
+            return ()
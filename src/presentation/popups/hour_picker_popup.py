@@ -14,6 +14,9 @@ from ..widgets import DebouncedButton
 
 logger = logging.getLogger(__name__)
 
+# Button labels for hours 0-23
+_HOUR_LABELS = tuple(f"{h:02d}" for h in range(24))
+
 
 class HourPickerPopup(Popup):
     """Hour picker popup - simple grid of hours"""
@@ -63,16 +66,18 @@ class HourPickerPopup(Popup):
         hour_grid.bind(minimum_height=hour_grid.setter('height'))
         
         self.hour_buttons = []
-        for hour in range(24):
+        for hour, label in enumerate(_HOUR_LABELS):
             btn = DebouncedButton(
-                text=f"{hour:02d}",
+                text=label,
                 font_size='18sp',
                 size_hint_y=None,
                 height='50dp',
                 background_color=(0.4, 0.4, 0.4, 1) if hour != self.selected_hour else (0.2, 0.6, 0.9, 1),
                 color=(1, 1, 1, 1)
             )
-            btn.bind(on_release=lambda instance, h=hour: self._select_hour(h))
+            # One shared handler reads the hour off the button
+            btn._hour = hour
+            btn.bind(on_release=self._on_hour_btn)
             hour_grid.add_widget(btn)
             self.hour_buttons.append(btn)
         
@@ -120,6 +125,17 @@ class HourPickerPopup(Popup):
         main_layout.add_widget(right_panel)
         self.content = main_layout
     
+    def reset(self, current_hour=None, on_select=None):
+        """Re-point a cached picker at a new hour and callback without rebuilding its grid"""
+        self.on_select_callback = on_select
+        self.selected_hour = current_hour if current_hour is not None else 12
+        self._update_display()
+        self._update_button_colors()
+    
+    def _on_hour_btn(self, btn):
+        """Shared on_release handler for all hour buttons"""
+        self._select_hour(btn._hour)
+    
     def _select_hour(self, hour):
         """Select an hour"""
         self.selected_hour = hour
@@ -1,8 +1,10 @@
 """
 Limited date picker popup with min/max date constraints.
 """
+import calendar
 import datetime
 import logging
+from functools import partial
 from kivy.uix.popup import Popup
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
@@ -14,9 +16,26 @@ from kivy.properties import ObjectProperty
 from kivy.app import App
 
 from ..widgets import DebouncedButton
+from .date_picker_popup import (
+    _CALENDAR, _GERMAN_MONTHS, _SELECTED_COLORS, _TODAY_COLORS, _DEFAULT_COLORS
+)
 
 logger = logging.getLogger(__name__)
 
+# Dark gray (background, text) colors for days outside the allowed range
+_DISABLED_COLORS = ((0.2, 0.2, 0.2, 1), (0.5, 0.5, 0.5, 1))
+
+
+def _day_colors(is_selected, is_today, is_valid):
+    """Return the (background, text) colors for a day button"""
+    if not is_valid:
+        return _DISABLED_COLORS
+    if is_selected:
+        return _SELECTED_COLORS
+    if is_today:
+        return _TODAY_COLORS
+    return _DEFAULT_COLORS
+
 
 class LimitedDatePickerPopup(Popup):
     """Date picker with min/max date limits"""
@@ -31,14 +50,7 @@ class LimitedDatePickerPopup(Popup):
         self.size_hint = (0.95, 0.95)
         self.auto_dismiss = False
         
-        if current_date is None:
-            current_date = self.max_date
-        
-        # Ensure current_date is within range
-        if self.min_date and current_date < self.min_date:
-            current_date = self.min_date
-        if current_date > self.max_date:
-            current_date = self.max_date
+        current_date = self._clamp_date(current_date)
         
         self.display_date = current_date
         self.selected_day = current_date.day
@@ -58,10 +70,10 @@ class LimitedDatePickerPopup(Popup):
             size_hint_x=0.15,
             background_color=(0.3, 0.5, 0.7, 1)
         )
-        prev_month_btn.bind(on_release=lambda x: self._change_month(-1))
+        prev_month_btn.bind(on_release=partial(self._change_month, -1))
         
         month_year_label = Label(
-            text=f"{self._get_month_name(current_date.month)} {current_date.year}",
+            text=f"{_GERMAN_MONTHS[current_date.month]} {current_date.year}",
             font_size='22sp',
             size_hint_x=0.7,
             bold=True
@@ -73,7 +85,7 @@ class LimitedDatePickerPopup(Popup):
             size_hint_x=0.15,
             background_color=(0.3, 0.5, 0.7, 1)
         )
-        next_month_btn.bind(on_release=lambda x: self._change_month(1))
+        next_month_btn.bind(on_release=partial(self._change_month, 1))
         
         header.add_widget(prev_month_btn)
         header.add_widget(month_year_label)
@@ -167,11 +179,28 @@ class LimitedDatePickerPopup(Popup):
         self._update_calendar()
         self._update_selected_label()
     
-    def _get_month_name(self, month):
-        """Get German month name"""
-        months = ['', 'Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
-                  'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember']
-        return months[month]
+    def reset(self, current_date=None, min_date=None, max_date=None, on_select=None):
+        """Re-point a cached popup at a new date, range and callback without rebuilding it"""
+        self.on_select_callback = on_select
+        self.min_date = min_date
+        self.max_date = max_date or datetime.date.today()
+        current_date = self._clamp_date(current_date)
+        
+        self.display_date = current_date
+        self.selected_day = current_date.day
+        self.month_year_label.text = f"{_GERMAN_MONTHS[current_date.month]} {current_date.year}"
+        self._update_calendar()
+        self._update_selected_label()
+    
+    def _clamp_date(self, current_date):
+        """Default to max_date and ensure the date is within range"""
+        if current_date is None:
+            current_date = self.max_date
+        if self.min_date and current_date < self.min_date:
+            current_date = self.min_date
+        if current_date > self.max_date:
+            current_date = self.max_date
+        return current_date
     
     def _is_date_valid(self, date):
         """Check if date is within allowed range"""
@@ -181,7 +210,16 @@ class LimitedDatePickerPopup(Popup):
             return False
         return True
     
-    def _change_month(self, delta):
+    def _valid_day_range(self, year, month, days_in_month):
+        """Return the (first, last) selectable day numbers of a month; first > last if none"""
+        first, last = 1, days_in_month
+        if self.min_date and (self.min_date.year, self.min_date.month) == (year, month):
+            first = self.min_date.day
+        if (self.max_date.year, self.max_date.month) == (year, month):
+            last = min(last, self.max_date.day)
+        return first, last
+    
+    def _change_month(self, delta, *_):
         """Change displayed month, respecting limits"""
         year = self.display_date.year
         month = self.display_date.month + delta
@@ -206,7 +244,7 @@ class LimitedDatePickerPopup(Popup):
             return  # Can't go after max_date
         
         self.display_date = new_display
-        self.month_year_label.text = f"{self._get_month_name(month)} {year}"
+        self.month_year_label.text = f"{_GERMAN_MONTHS[month]} {year}"
         self._update_calendar()
     
     def _select_today(self):
@@ -215,63 +253,48 @@ class LimitedDatePickerPopup(Popup):
         if self._is_date_valid(today):
             self.display_date = today
             self.selected_day = today.day
-            self.month_year_label.text = f"{self._get_month_name(today.month)} {today.year}"
+            self.month_year_label.text = f"{_GERMAN_MONTHS[today.month]} {today.year}"
             self._update_calendar()
             self._update_selected_label()
     
     def _update_selected_label(self):
         """Update the label showing selected date"""
-        try:
-            date = datetime.date(
-                self.display_date.year,
-                self.display_date.month,
-                self.selected_day
-            )
-            if self._is_date_valid(date):
-                self.selected_date_label.text = date.strftime("%d.%m.%Y")
-            else:
-                self.selected_date_label.text = "Ungültig"
-        except ValueError:
+        d, m, y = self.selected_day, self.display_date.month, self.display_date.year
+        # day_buttons holds one button per day of the displayed month (rendered first)
+        days_in_month = len(self.day_buttons)
+        if not 1 <= d <= days_in_month:
             self.selected_date_label.text = ""
+            return
+        first_valid, last_valid = self._valid_day_range(y, m, days_in_month)
+        if first_valid <= d <= last_valid:
+            self.selected_date_label.text = f"{d:02d}.{m:02d}.{y:04d}"
+        else:
+            self.selected_date_label.text = "Ungültig"
     
     def _update_calendar(self):
         """Update the calendar grid with days, disabling invalid dates"""
-        self.days_grid.clear_widgets()
         self.day_buttons = []
         
-        first_day = datetime.date(self.display_date.year, self.display_date.month, 1)
-        first_weekday = first_day.weekday()
-        
-        if self.display_date.month == 12:
-            next_month = datetime.date(self.display_date.year + 1, 1, 1)
-        else:
-            next_month = datetime.date(self.display_date.year, self.display_date.month + 1, 1)
-        days_in_month = (next_month - first_day).days
-        
-        # Add empty cells
-        for _ in range(first_weekday):
-            empty = Widget(size_hint_y=None, height='50dp')
-            self.days_grid.add_widget(empty)
-        
+        year, month = self.display_date.year, self.display_date.month
+        days_in_month = calendar.monthrange(year, month)[1]
+        # Compare plain day numbers instead of building a date per cell
+        first_valid, last_valid = self._valid_day_range(year, month, days_in_month)
         today = datetime.date.today()
-        for day in range(1, days_in_month + 1):
-            date = datetime.date(self.display_date.year, self.display_date.month, day)
-            is_today = (date == today)
+        today_day = today.day if (today.year, today.month) == (year, month) else -1
+        
+        # Build the month off-tree, then swap it into the grid in one go
+        cells = []
+        for day in _CALENDAR.itermonthdays(year, month):
+            if day == 0:
+                # Padding cell before the 1st / after the last day (whole weeks only)
+                cells.append(Widget(size_hint_y=None, height='50dp'))
+                continue
+            
+            is_today = (day == today_day)
             is_selected = (day == self.selected_day)
-            is_valid = self._is_date_valid(date)
+            is_valid = first_valid <= day <= last_valid
             
-            if is_selected and is_valid:
-                bg_color = (0.2, 0.6, 0.9, 1)
-                text_color = (1, 1, 1, 1)
-            elif is_today and is_valid:
-                bg_color = (0.3, 0.7, 0.3, 1)
-                text_color = (1, 1, 1, 1)
-            elif is_valid:
-                bg_color = (0.4, 0.4, 0.4, 1)
-                text_color = (1, 1, 1, 1)
-            else:
-                bg_color = (0.2, 0.2, 0.2, 1)  # Dark gray for disabled
-                text_color = (0.5, 0.5, 0.5, 1)
+            bg_color, text_color = _day_colors(is_selected, is_today, is_valid)
             
             btn = DebouncedButton(
                 text=str(day),
@@ -283,47 +306,38 @@ class LimitedDatePickerPopup(Popup):
                 disabled=not is_valid
             )
             if is_valid:
-                btn.bind(on_release=lambda instance, d=day: self._select_day(d))
-            self.days_grid.add_widget(btn)
+                btn._day = day
+                btn.bind(on_release=self._on_day_btn)
+            cells.append(btn)
             self.day_buttons.append(btn)
         
-        # Fill remaining cells
-        total_cells = first_weekday + days_in_month
-        rows_needed = (total_cells + 6) // 7
-        total_slots = rows_needed * 7
-        
-        for _ in range(total_slots - total_cells):
-            empty = Widget(size_hint_y=None, height='50dp')
-            self.days_grid.add_widget(empty)
+        days_grid = self.days_grid
+        days_grid.clear_widgets()
+        for widget in cells:
+            days_grid.add_widget(widget)
+    
+    def _on_day_btn(self, btn):
+        """Shared on_release handler for all selectable day buttons"""
+        self._select_day(btn._day)
     
     def _select_day(self, day):
         """Select a day"""
-        date = datetime.date(self.display_date.year, self.display_date.month, day)
-        if self._is_date_valid(date):
+        year, month = self.display_date.year, self.display_date.month
+        first_valid, last_valid = self._valid_day_range(year, month, len(self.day_buttons))
+        if first_valid <= day <= last_valid:
             self.selected_day = day
             self._update_selected_label()
             
             # Update button colors
             today = datetime.date.today()
+            today_day = today.day if (today.year, today.month) == (year, month) else -1
             for i, btn in enumerate(self.day_buttons):
                 day_num = i + 1
-                date_check = datetime.date(self.display_date.year, self.display_date.month, day_num)
-                is_today = (date_check == today)
+                is_today = (day_num == today_day)
                 is_selected = (day_num == day)
-                is_valid = self._is_date_valid(date_check)
+                is_valid = first_valid <= day_num <= last_valid
                 
-                if is_selected and is_valid:
-                    btn.background_color = (0.2, 0.6, 0.9, 1)
-                    btn.color = (1, 1, 1, 1)
-                elif is_today and is_valid:
-                    btn.background_color = (0.3, 0.7, 0.3, 1)
-                    btn.color = (1, 1, 1, 1)
-                elif is_valid:
-                    btn.background_color = (0.4, 0.4, 0.4, 1)
-                    btn.color = (1, 1, 1, 1)
-                else:
-                    btn.background_color = (0.2, 0.2, 0.2, 1)
-                    btn.color = (0.5, 0.5, 0.5, 1)
+                btn.background_color, btn.color = _day_colors(is_selected, is_today, is_valid)
                 btn.disabled = not is_valid
     
     def _confirm_date(self):
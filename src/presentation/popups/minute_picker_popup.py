@@ -14,6 +14,10 @@ from ..widgets import DebouncedButton
 
 logger = logging.getLogger(__name__)
 
+# Selectable minutes (5-minute steps) and their button labels
+_MINUTE_VALUES = tuple(range(0, 60, 5))
+_MINUTE_LABELS = tuple(f"{m:02d}" for m in _MINUTE_VALUES)
+
 
 class MinutePickerPopup(Popup):
     """Minute picker popup - simple grid of minutes"""
@@ -66,17 +70,18 @@ class MinutePickerPopup(Popup):
         minute_grid.bind(minimum_height=minute_grid.setter('height'))
         
         self.minute_buttons = []
-        minute_values = list(range(0, 60, 5))
-        for minute in minute_values:
+        for minute, label in zip(_MINUTE_VALUES, _MINUTE_LABELS):
             btn = DebouncedButton(
-                text=f"{minute:02d}",
+                text=label,
                 font_size='18sp',
                 size_hint_y=None,
                 height='50dp',
                 background_color=(0.4, 0.4, 0.4, 1) if minute != self.selected_minute else (0.2, 0.6, 0.9, 1),
                 color=(1, 1, 1, 1)
             )
-            btn.bind(on_release=lambda instance, m=minute: self._select_minute(m))
+            # One shared handler reads the minute off the button
+            btn._minute = minute
+            btn.bind(on_release=self._on_minute_btn)
             minute_grid.add_widget(btn)
             self.minute_buttons.append(btn)
         
@@ -124,6 +129,18 @@ class MinutePickerPopup(Popup):
         main_layout.add_widget(right_panel)
         self.content = main_layout
     
+    def reset(self, current_minute=None, on_select=None):
+        """Re-point a cached picker at a new minute and callback without rebuilding its grid"""
+        self.on_select_callback = on_select
+        # Round to nearest 5 minutes
+        self.selected_minute = (current_minute // 5) * 5 if current_minute is not None else 0
+        self._update_display()
+        self._update_button_colors()
+    
+    def _on_minute_btn(self, btn):
+        """Shared on_release handler for all minute buttons"""
+        self._select_minute(btn._minute)
+    
     def _select_minute(self, minute):
         """Select a minute"""
         self.selected_minute = minute
@@ -136,9 +153,8 @@ class MinutePickerPopup(Popup):
     
     def _update_button_colors(self):
         """Update button colors to show selection"""
-        minute_values = list(range(0, 60, 5))
-        for i, btn in enumerate(self.minute_buttons):
-            if minute_values[i] == self.selected_minute:
+        for minute, btn in zip(_MINUTE_VALUES, self.minute_buttons):
+            if minute == self.selected_minute:
                 btn.background_color = (0.2, 0.6, 0.9, 1)
             else:
                 btn.background_color = (0.4, 0.4, 0.4, 1)
@@ -15,6 +15,13 @@ class TimePickerPopup:
     """Time picker that chains hour and minute selection"""
     
     def __init__(self, current_time=None, on_select=None, **kwargs):
+        # Hour and minute grids built on first open and reused afterwards
+        self._hour_picker = None
+        self._minute_picker = None
+        self.reset(current_time, on_select=on_select)
+    
+    def reset(self, current_time=None, on_select=None):
+        """Re-point a cached picker at a new time and callback"""
         self.on_select_callback = on_select
         now = current_time or datetime.datetime.now().time()
         self.selected_hour = now.hour
@@ -22,19 +29,31 @@ class TimePickerPopup:
     
     def _open_hour_picker(self):
         """Open hour picker first"""
-        HourPickerPopup(
-            current_hour=self.selected_hour,
-            on_select=self._on_hour_selected
-        ).open()
+        if self._hour_picker is None:
+            self._hour_picker = HourPickerPopup(
+                current_hour=self.selected_hour,
+                on_select=self._on_hour_selected
+            )
+        else:
+            self._hour_picker.reset(self.selected_hour, on_select=self._on_hour_selected)
+        self._hour_picker.open()
     
     def _on_hour_selected(self, hour):
         """Called when hour is selected, open minute picker"""
         self.selected_hour = hour
         # Small delay to ensure hour picker is dismissed before opening minute picker
-        Clock.schedule_once(lambda dt: MinutePickerPopup(
-            current_minute=self.selected_minute,
-            on_select=self._on_minute_selected
-        ).open(), 0.05)
+        Clock.schedule_once(lambda dt: self._open_minute_picker(), 0.05)
+    
+    def _open_minute_picker(self):
+        """Open the minute picker once an hour is chosen"""
+        if self._minute_picker is None:
+            self._minute_picker = MinutePickerPopup(
+                current_minute=self.selected_minute,
+                on_select=self._on_minute_selected
+            )
+        else:
+            self._minute_picker.reset(self.selected_minute, on_select=self._on_minute_selected)
+        self._minute_picker.open()
     
     def _on_minute_selected(self, minute):
         """Called when minute is selected, combine and call callback"""
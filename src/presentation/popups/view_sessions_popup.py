@@ -85,7 +85,9 @@ class MonthPickerPopup(Popup):
                 font_size='16sp',
                 background_color=self._get_month_color(month_num)
             )
-            btn.bind(on_release=lambda inst, m=month_num: self._select_month(m))
+            # Month number lives on the button; one shared handler serves all twelve
+            btn._month = month_num
+            btn.bind(on_release=self._on_month_btn)
             month_grid.add_widget(btn)
             self.month_buttons.append(btn)
         
@@ -122,6 +124,10 @@ class MonthPickerPopup(Popup):
         self.selected_year += delta
         self.year_label.text = str(self.selected_year)
     
+    def _on_month_btn(self, btn):
+        """Shared on_release handler for the month buttons"""
+        self._select_month(btn._month)
+    
     def _select_month(self, month_num):
         """Select a month and close popup"""
         self.selected_month = month_num
@@ -140,24 +146,36 @@ class ViewSessionsPopup(Popup):
             auto_dismiss=False,
             **kwargs
         )
-        self.employee = employee
+        self._set_employee(employee)
+        self._register()
+        
+        self._build_ui()
+        self._load_month_report()
         
-        # Default to current month
+        # Ensure proper cleanup on dismiss
+        self.bind(on_dismiss=self._on_dismiss)
+    
+    def reset(self, employee):
+        """Reuse this popup for another employee without rebuilding the widget tree"""
+        self._set_employee(employee)
+        self.title = f"Sessions - {employee.name}"
+        self._register()
+        self.month_btn.text = self._get_month_display_text()
+        self._load_month_report()
+    
+    def _set_employee(self, employee):
+        """Point the popup at an employee, defaulting to the current month"""
+        self.employee = employee
         today = datetime.date.today()
         self.selected_year = today.year
         self.selected_month = today.month
-        
-        # Register with popup service for proper management
+    
+    def _register(self):
+        """Register with popup service for proper management"""
         app = App.get_running_app()
         if app and hasattr(app, 'popup_service'):
             app.popup_service.close_main_popup()  # Close any existing main popup
             app.popup_service._register_popup(self, is_main=True)
-        
-        self._build_ui()
-        self._load_month_report()
-        
-        # Ensure proper cleanup on dismiss
-        self.bind(on_dismiss=self._on_dismiss)
     
     def _on_dismiss(self, instance):
         """Cleanup when popup is dismissed"""
@@ -86,6 +86,7 @@ class MatrixRain(FloatLayout):
 class ScreensaverScreen(Screen):
     time_str = StringProperty("00:00")
     date_str = StringProperty("Mon, 01 Jan")
+    _clock_event = None  # Time label update interval while the screensaver is shown
     
     def on_enter(self):
         # Start Matrix Rain
@@ -99,8 +100,9 @@ class ScreensaverScreen(Screen):
     def on_leave(self):
         if hasattr(self.ids, 'matrix_bg'):
             self.ids.matrix_bg.stop_animation()
-        if hasattr(self, '_clock_event'):
+        if self._clock_event is not None:
             self._clock_event.cancel()
+            self._clock_event = None
 
     def update_time(self, *args):
         now = datetime.datetime.now()
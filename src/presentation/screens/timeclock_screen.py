@@ -9,11 +9,16 @@ from kivy.clock import Clock
 class TimeClockScreen(Screen):
     status_message = StringProperty("Ready")
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Single reusable event; rapid scans restart the countdown instead of stacking resets
+        self._reset_status_trigger = Clock.create_trigger(self.set_default_status, 3)
+
     def update_status(self, message):
         self.status_message = message
-        # Clear message after 3 seconds
-        Clock.schedule_once(lambda dt: self.set_default_status(), 3)
+        # Clear message after 3 seconds (a pending trigger ignores re-calls, so cancel first)
+        self._reset_status_trigger.cancel()
+        self._reset_status_trigger()
 
-    def set_default_status(self):
+    def set_default_status(self, *_):
         self.status_message = "Ready"
-
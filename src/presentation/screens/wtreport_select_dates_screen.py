@@ -3,6 +3,7 @@ WT Report date selection screen.
 """
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from kivy.uix.screenmanager import Screen
 from kivy.properties import ObjectProperty
 from kivy.app import App
@@ -14,12 +15,20 @@ from ...utils.export_utils import get_export_directory
 
 logger = logging.getLogger(__name__)
 
+# Single worker thread for report generation and file export so the UI stays responsive
+_report_executor = ThreadPoolExecutor(max_workers=1)
+
 
 class WTReportSelectDatesScreen(Screen):
     selected_employee = ObjectProperty(None, allownone=True)
     start_date = ObjectProperty(None, allownone=True)
     end_date = ObjectProperty(None, allownone=True)
     
+    # Date picker is built once and reused for both start and end date selection
+    _date_popup = None
+    # Set while a report task is running on the worker thread
+    _report_busy = False
+    
     def on_enter(self):
         """Set default dates when screen is entered"""
         today = datetime.date.today()
@@ -33,8 +42,9 @@ class WTReportSelectDatesScreen(Screen):
         """Update the date display buttons"""
         if not hasattr(self, 'ids'):
             return
-        start_text = f"Von:\n{self.start_date.strftime('%d.%m.%Y')}" if self.start_date else "Von:\nDatum wählen"
-        end_text = f"Bis:\n{self.end_date.strftime('%d.%m.%Y')}" if self.end_date else "Bis:\nDatum wählen"
+        start, end = self.start_date, self.end_date
+        start_text = f"Von:\n{start.day:02d}.{start.month:02d}.{start.year:04d}" if start else "Von:\nDatum wählen"
+        end_text = f"Bis:\n{end.day:02d}.{end.month:02d}.{end.year:04d}" if end else "Bis:\nDatum wählen"
         if 'start_date_button' in self.ids:
             self.ids.start_date_button.text = start_text
         if 'end_date_button' in self.ids:
@@ -42,17 +52,19 @@ class WTReportSelectDatesScreen(Screen):
     
     def open_start_date_picker(self):
         """Open date picker for start date"""
-        DatePickerPopup(
-            current_date=self.start_date or datetime.date.today(),
-            on_select=self._set_start_date
-        ).open()
+        self._open_date_picker(self.start_date or datetime.date.today(), self._set_start_date)
     
     def open_end_date_picker(self):
         """Open date picker for end date"""
-        DatePickerPopup(
-            current_date=self.end_date or datetime.date.today(),
-            on_select=self._set_end_date
-        ).open()
+        self._open_date_picker(self.end_date or datetime.date.today(), self._set_end_date)
+    
+    def _open_date_picker(self, current_date, on_select):
+        """Open the shared date picker, building it only on first use"""
+        if self._date_popup is None:
+            self._date_popup = DatePickerPopup(current_date=current_date, on_select=on_select)
+        else:
+            self._date_popup.reset(current_date, on_select=on_select)
+        self._date_popup.open()
     
     def _set_start_date(self, date):
         self.start_date = date
@@ -72,23 +84,24 @@ class WTReportSelectDatesScreen(Screen):
             App.get_running_app().show_popup("Error", "Bitte wählen Sie Start- und Enddatum aus.")
             return
         
-        try:
-            # Generate report using selected dates
-            report = generate_wt_report(self.selected_employee, self.start_date, self.end_date)
-            
-            # Navigate to display screen
-            app = App.get_running_app()
-            display_screen = app.root.get_screen('wtreport_display')
-            display_screen.selected_employee = self.selected_employee
-            display_screen.current_report = report
-            display_screen.start_date = self.start_date
-            display_screen.end_date = self.end_date
-            display_screen.update_report_display()
-            app.root.current = 'wtreport_display'
-            
-        except Exception as e:
-            logger.error(f"Error generating report: {e}")
-            App.get_running_app().show_popup("Error", f"Failed to generate report: {str(e)}")
+        employee, start_date, end_date = self.selected_employee, self.start_date, self.end_date
+        self._submit_report_task(
+            lambda: generate_wt_report(employee, start_date, end_date),
+            self._on_report_ready,
+            "Error generating report",
+            "Failed to generate report"
+        )
+    
+    def _on_report_ready(self, report):
+        """Show the generated report (runs on the UI thread)"""
+        app = App.get_running_app()
+        display_screen = app.root.get_screen('wtreport_display')
+        display_screen.selected_employee = report.employee
+        display_screen.current_report = report
+        display_screen.start_date = report.start_date
+        display_screen.end_date = report.end_date
+        display_screen.update_report_display()
+        app.root.current = 'wtreport_display'
     
     def export_report(self):
         """Export report directly without displaying"""
@@ -100,20 +113,61 @@ class WTReportSelectDatesScreen(Screen):
             App.get_running_app().show_popup("Error", "Bitte wählen Sie Start- und Enddatum aus.")
             return
         
-        try:
+        employee, start_date, end_date = self.selected_employee, self.start_date, self.end_date
+        
+        def _export():
             # Generate and export report using selected dates
-            report = generate_wt_report(self.selected_employee, self.start_date, self.end_date)
-            export_dir = get_export_directory()
-            filename = report.to_csv(export_root=export_dir)
-            
-            # Show success message and return to admin
-            app = App.get_running_app()
-            app.show_popup("Export Erfolgreich", f"WT Report exportiert nach:\n{filename}")
-            Clock.schedule_once(lambda dt: setattr(app.root, 'current', 'admin'), 2.5)
-            
+            report = generate_wt_report(employee, start_date, end_date)
+            return report.to_csv(export_root=get_export_directory())
+        
+        self._submit_report_task(
+            _export,
+            self._on_export_done,
+            "Error exporting report",
+            "Export fehlgeschlagen"
+        )
+    
+    def _on_export_done(self, filename):
+        """Show success message and return to admin (runs on the UI thread)"""
+        app = App.get_running_app()
+        app.show_popup("Export Erfolgreich", f"WT Report exportiert nach:\n{filename}")
+        Clock.schedule_once(self._goto_admin, 2.5)
+    
+    def _goto_admin(self, dt):
+        """Return to the admin screen after an export"""
+        App.get_running_app().root.current = 'admin'
+    
+    def _submit_report_task(self, task, on_success, log_message, error_message):
+        """
+        Run a report task on the worker thread and hand its result back to the UI thread.
+        
+        Args:
+            task: Callable doing the blocking DB/file work
+            on_success: Called with the task result on the UI thread
+            log_message: Prefix for the log entry on failure
+            error_message: Prefix for the error popup on failure
+        """
+        if self._report_busy:
+            return
+        self._report_busy = True
+        
+        future = _report_executor.submit(task)
+        future.add_done_callback(
+            lambda fut: Clock.schedule_once(
+                lambda dt: self._on_report_task_done(fut, on_success, log_message, error_message), 0
+            )
+        )
+    
+    def _on_report_task_done(self, future, on_success, log_message, error_message):
+        """Dispatch a finished report task (runs on the UI thread)"""
+        self._report_busy = False
+        try:
+            result = future.result()
         except Exception as e:
-            logger.error(f"Error exporting report: {e}")
-            App.get_running_app().show_popup("Error", f"Export fehlgeschlagen: {str(e)}")
+            logger.error(f"{log_message}: {e}")
+            App.get_running_app().show_popup("Error", f"{error_message}: {str(e)}")
+            return
+        on_success(result)
 
     def export_lgav_excel(self):
         """Export report to Excel in L-GAV format directly"""
@@ -132,7 +186,7 @@ class WTReportSelectDatesScreen(Screen):
             
             app = App.get_running_app()
             app.show_popup("Export Erfolgreich", f"L-GAV Excel Report exportiert nach:\n{filename}")
-            Clock.schedule_once(lambda dt: setattr(app.root, 'current', 'admin'), 2.5)
+            Clock.schedule_once(self._goto_admin, 2.5)
             
         except Exception as e:
             logger.error(f"Error exporting L-GAV Excel report: {e}")
@@ -155,7 +209,7 @@ class WTReportSelectDatesScreen(Screen):
             
             app = App.get_running_app()
             app.show_popup("Export Erfolgreich", f"L-GAV CSV Report exportiert nach:\n{filename}")
-            Clock.schedule_once(lambda dt: setattr(app.root, 'current', 'admin'), 2.5)
+            Clock.schedule_once(self._goto_admin, 2.5)
             
         except Exception as e:
             logger.error(f"Error exporting L-GAV CSV report: {e}")
@@ -178,7 +232,7 @@ class WTReportSelectDatesScreen(Screen):
             
             app = App.get_running_app()
             app.show_popup("Export Erfolgreich", f"L-GAV PDF Report exportiert nach:\n{filename}")
-            Clock.schedule_once(lambda dt: setattr(app.root, 'current', 'admin'), 2.5)
+            Clock.schedule_once(self._goto_admin, 2.5)
             
         except Exception as e:
             logger.error(f"Error exporting L-GAV PDF report: {e}")
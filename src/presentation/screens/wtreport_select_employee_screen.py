@@ -4,43 +4,60 @@ WT Report employee selection screen.
 import logging
 from kivy.uix.screenmanager import Screen
 from kivy.app import App
+from kivy.clock import Clock
+from kivy.metrics import dp, sp
 
-from ...data.database import get_all_employees
+from ...data.database import get_cached_employees
 from ..widgets import DebouncedButton
 
 logger = logging.getLogger(__name__)
 
+# Employee button metrics, resolved once rather than parsed for every button
+_BUTTON_HEIGHT = dp(80)
+_BUTTON_FONT_SIZE = sp(24)
+
 
 class WTReportSelectEmployeeScreen(Screen):
     def on_enter(self):
         """Load employees when screen is entered"""
-        self.load_employees()
+        # Defer by one frame so the screen transition isn't blocked by widget creation
+        Clock.schedule_once(lambda dt: self.load_employees(), 0)
     
     def load_employees(self):
         """Load list of employees and create selection buttons"""
         try:
-            employees = list(get_all_employees(include_inactive=False))
+            employees = get_cached_employees()
             
-            # Clear existing buttons
             if hasattr(self, 'ids') and 'employee_buttons_container' in self.ids:
                 container = self.ids.employee_buttons_container
-                container.clear_widgets()
                 
-                # Create button for each employee
+                # Build all buttons before touching the container so the grid
+                # is swapped in one go and laid out in a single pass
+                buttons = []
                 for employee in employees:
                     btn = DebouncedButton(
                         text=f"{employee.name} ({employee.rfid_tag})",
                         size_hint_y=None,
-                        height='80dp',
-                        font_size='24sp'
+                        height=_BUTTON_HEIGHT,
+                        font_size=_BUTTON_FONT_SIZE
                     )
-                    # Bind button to select this employee
-                    btn.bind(on_release=lambda instance, emp=employee: self.select_employee(emp))
+                    # Bind button to select this employee (shared handler, no per-button closure)
+                    btn._employee = employee
+                    btn.bind(on_release=self._on_employee_btn)
+                    buttons.append(btn)
+                
+                # Replace existing buttons
+                container.clear_widgets()
+                for btn in buttons:
                     container.add_widget(btn)
                     
         except Exception as e:
             logger.error(f"Error loading employees: {e}")
     
+    def _on_employee_btn(self, btn):
+        """Shared on_release handler for all employee buttons"""
+        self.select_employee(btn._employee)
+    
     def select_employee(self, employee):
         """Select an employee and navigate to date selection screen"""
         app = App.get_running_app()
@@ -5,9 +5,12 @@ import logging
 import threading
 from kivy.uix.popup import Popup
 from kivy.uix.label import Label
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.scrollview import ScrollView
 from kivy.clock import Clock
 
 from ..presentation.popups.greeter_popup import GreeterPopup
+from ..presentation.widgets import DebouncedButton
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,11 @@ class PopupService:
         self._current_main_popup = None  # Track the main popup (non-nested)
         self._dismissing_popups = set()  # Track popups currently being dismissed
         self._lock = threading.Lock()  # Lock for thread-safe operations
+        self._greeter_popup = None  # Single greeter reused for every clock action
+        # One trigger, re-pointed and re-armed per popup, auto-dismisses all
+        # info/error/success popups (a new one replaces the previous one)
+        self._auto_dismiss_popup = None
+        self._auto_dismiss_trigger = Clock.create_trigger(self._on_auto_dismiss)
     
     def _register_popup(self, popup, is_main=False):
         """Register a popup for tracking (thread-safe)"""
@@ -37,8 +45,10 @@ class PopupService:
             
             if popup not in self._open_popups:
                 self._open_popups.append(popup)
-                # Bind to dismiss event to clean up
-                popup.bind(on_dismiss=lambda instance: self._unregister_popup(instance))
+                # Bind to dismiss event to clean up (once - reused popups register repeatedly)
+                if not getattr(popup, '_popup_service_bound', False):
+                    popup.bind(on_dismiss=lambda instance: self._unregister_popup(instance))
+                    popup._popup_service_bound = True
             
             if is_main:
                 # Close previous main popup if exists
@@ -88,8 +98,11 @@ class PopupService:
     def _cleanup_popup(self, popup):
         """Final cleanup check for popup"""
         if popup:
-            # Check if popup is still in our tracking list
+            # A reused popup may have been reopened (and re-registered) in the meantime;
+            # only popups still pending dismissal need cleaning up
             with self._lock:
+                if popup not in self._dismissing_popups:
+                    return
                 is_open = popup in self._open_popups
             if is_open:
                 try:
@@ -139,7 +152,25 @@ class PopupService:
         
         # Open the popup
         popup.open()
-        Clock.schedule_once(lambda dt: self._safe_dismiss(popup), duration)
+        self._arm_auto_dismiss(popup, duration)
+    
+    def _arm_auto_dismiss(self, popup, duration: float):
+        """Point the shared dismiss trigger at the popup and restart its countdown"""
+        trigger = self._auto_dismiss_trigger
+        trigger.cancel()
+        previous = self._auto_dismiss_popup
+        if previous is not None and previous is not popup:
+            # Custom titles escape _close_simple_popups; close it here instead of
+            # leaving it without a countdown
+            self._safe_dismiss(previous)
+        self._auto_dismiss_popup = popup
+        trigger.timeout = duration
+        trigger()
+    
+    def _on_auto_dismiss(self, dt):
+        """Dismiss the notification popup whose countdown ran out"""
+        popup, self._auto_dismiss_popup = self._auto_dismiss_popup, None
+        self._safe_dismiss(popup)
     
     def _close_simple_popups(self):
         """Close simple notification popups (thread-safe)"""
@@ -189,7 +220,7 @@ class PopupService:
         
         # Open the popup
         popup.open()
-        Clock.schedule_once(lambda dt: self._safe_dismiss(popup), duration)
+        self._arm_auto_dismiss(popup, duration)
     
     def show_success(self, title: str, message: str, duration: float = 3.0):
         """
@@ -214,7 +245,7 @@ class PopupService:
         
         # Open the popup
         popup.open()
-        Clock.schedule_once(lambda dt: self._safe_dismiss(popup), duration)
+        self._arm_auto_dismiss(popup, duration)
     
     def show_greeter(self, employee, action: str):
         """
@@ -224,21 +255,18 @@ class PopupService:
             employee: Employee object
             action: 'in' or 'out'
         """
-        # Import here to avoid circular imports
-        from ..presentation.popups.greeter_popup import GreeterPopup
-        
-        # Close any existing greeter popups (thread-safe)
-        with self._lock:
-            greeter_popups = [p for p in list(self._open_popups) if isinstance(p, GreeterPopup)]
+        popup = self._greeter_popup
+        if popup is None:
+            popup = self._greeter_popup = GreeterPopup()
         
-        for popup in greeter_popups:
-            self._force_dismiss(popup)
+        # Update contents in place; an already visible greeter just shows the new greeting
+        popup.set_content(employee, action)
         
-        popup = GreeterPopup(employee, action)
-        self._register_popup(popup, is_main=False)
-        
-        # Open the popup
-        popup.open()
+        with self._lock:
+            is_open = popup in self._open_popups
+        if not is_open:
+            self._register_popup(popup, is_main=False)
+            popup.open()
     
     def show_report(self, title: str, report_text: str, size_hint=(0.95, 0.95)):
         """
@@ -249,10 +277,6 @@ class PopupService:
             report_text: Report text content
             size_hint: Size hint tuple for popup (default: (0.95, 0.95))
         """
-        from kivy.uix.boxlayout import BoxLayout
-        from kivy.uix.scrollview import ScrollView
-        from ..presentation.widgets import DebouncedButton
-        
         # Create scrollable content
         content = BoxLayout(orientation='vertical', spacing=10, padding=10)
         
@@ -90,9 +90,9 @@ class WorkingTimeReport:
             'summary': self._generate_summary()
         }
     
-    def _get_time_entries(self) -> List[TimeEntry]:
+    def _get_time_entries(self) -> List[tuple]:
         """
-        Get time entries for the employee.
+        Get time entries for the employee as (id, timestamp, action) namedtuples.
         
         To properly handle sessions spanning midnight, we need to:
         1. Include entries from before start_date (to match pending clock-ins)
@@ -100,7 +100,8 @@ class WorkingTimeReport:
         
         The filtering by date range happens when building sessions, not when querying entries.
         """
-        query = TimeEntry.select().where(
+        # Sessions only need these three columns; namedtuples skip model hydration
+        query = TimeEntry.select(TimeEntry.id, TimeEntry.timestamp, TimeEntry.action).where(
             TimeEntry.employee == self.employee,
             TimeEntry.active == True
         ).order_by(TimeEntry.timestamp.asc())
@@ -115,19 +116,21 @@ class WorkingTimeReport:
             query = query.where(TimeEntry.timestamp >= start_datetime)
         
         # End 1 day after end_date to catch clock-outs for sessions starting on end_date
+        # (half-open: everything before midnight two days after end_date)
         end_datetime = datetime.datetime.combine(
-            self.end_date + datetime.timedelta(days=1), 
-            datetime.time.max
+            self.end_date + datetime.timedelta(days=2),
+            datetime.time.min
         )
-        query = query.where(TimeEntry.timestamp <= end_datetime)
+        query = query.where(TimeEntry.timestamp < end_datetime)
         
-        entries = list(query)
+        entries = list(query.namedtuples())
         logger.info(f"Retrieved {len(entries)} entries for {self.employee.name} (range: {self.start_date} to {self.end_date})")
-        for e in entries:
-            logger.debug(f"  Entry: {e.timestamp} - {e.action}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for e in entries:
+                logger.debug("  Entry: %s - %s", e.timestamp, e.action)
         return entries
     
-    def _process_entries(self, entries: List[TimeEntry]):
+    def _process_entries(self, entries: List[tuple]):
         """
         Process time entries into daily work sessions.
         Handles sessions that span across midnight by processing all entries chronologically.
@@ -193,7 +196,9 @@ class WorkingTimeReport:
                     'clock_in_entry_id': clock_in_id,
                     'clock_out_entry_id': entry.id
                 })
-                logger.debug(f"Session created: {clock_in_time} -> {entry.timestamp} (date: {session_date}, duration: {_format_hms(total_seconds)})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Session created: %s -> %s (date: %s, duration: %s)",
+                                 clock_in_time, entry.timestamp, session_date, _format_hms(total_seconds))
         
         if pending_ins:
             logger.info(f"{len(pending_ins)} open session(s) for {self.employee.name} remain without a clock-out")
@@ -205,10 +210,10 @@ class WorkingTimeReport:
             
             # Filter: only include sessions where clock_in date is within the date range
             if self.start_date and session_date < self.start_date:
-                logger.debug(f"Skipping session {session['clock_in']} - before start_date {self.start_date}")
+                logger.debug("Skipping session %s - before start_date %s", session['clock_in'], self.start_date)
                 continue
             if session_date > self.end_date:
-                logger.debug(f"Skipping session {session['clock_in']} - after end_date {self.end_date}")
+                logger.debug("Skipping session %s - after end_date %s", session['clock_in'], self.end_date)
                 continue
             
             total_seconds = session.get('total_seconds', session['total_minutes'] * 60)
@@ -415,9 +420,10 @@ class WorkingTimeReport:
                 if date not in daily_totals:
                     daily_totals[date] = 0
                 daily_totals[date] += session['total_seconds']
-                logger.debug(f"LGAV: Including session on {date}: {session['clock_in']} -> {session['clock_out']} = {session['total_seconds']}s")
+                logger.debug("LGAV: Including session on %s: %s -> %s = %ss",
+                             date, session['clock_in'], session['clock_out'], session['total_seconds'])
             else:
-                logger.debug(f"LGAV: Excluding session on {date} (outside range {start} to {end})")
+                logger.debug("LGAV: Excluding session on %s (outside range %s to %s)", date, start, end)
         
         # Organize by months
         months = {}
@@ -4,6 +4,7 @@ Manages application-wide state like last clocked employee, pending identificatio
 """
 import time
 import logging
+from collections import OrderedDict
 from typing import Optional, Dict, Tuple
 from kivy.clock import Clock
 
@@ -23,10 +24,14 @@ class StateService:
     def __init__(self):
         self._last_clocked_employee: Optional[object] = None
         self._pending_identification: Optional[PendingIdentification] = None
-        self._recent_scan_times: Dict[str, float] = {}
-        self._employee_timeout_event = None
+        self._recent_scan_times: Dict[str, int] = OrderedDict()  # tag -> monotonic ms
         self.SCAN_DEBOUNCE_SECONDS = 1.2
         self.EMPLOYEE_TIMEOUT_SECONDS = 120
+        # Single reusable timer that clears last_clocked_employee after inactivity
+        self._employee_timeout_event = Clock.create_trigger(
+            self._on_employee_timeout, self.EMPLOYEE_TIMEOUT_SECONDS
+        )
+        self.MAX_TRACKED_SCANS = 128  # Bound debounce memory on long-running kiosks
     
     @property
     def last_clocked_employee(self):
@@ -42,34 +47,41 @@ class StateService:
     def clear_last_clocked_employee(self):
         """Clear last clocked employee"""
         self._last_clocked_employee = None
-        if self._employee_timeout_event:
-            self._employee_timeout_event.cancel()
-            self._employee_timeout_event = None
+        self._employee_timeout_event.cancel()
+    
+    def _on_employee_timeout(self, dt):
+        """Clock callback clearing last_clocked_employee"""
+        self.clear_last_clocked_employee()
     
     def _reset_clocked_employee_timer(self, timeout: int):
         """Reset timer that clears last_clocked_employee after inactivity"""
-        if self._employee_timeout_event:
-            self._employee_timeout_event.cancel()
-        self._employee_timeout_event = Clock.schedule_once(
-            lambda dt: self.clear_last_clocked_employee(),
-            timeout
-        )
+        # A pending trigger ignores repeated calls, so cancel first to restart the countdown
+        self._employee_timeout_event.cancel()
+        self._employee_timeout_event.timeout = timeout
+        self._employee_timeout_event()
     
     def is_recent_scan(self, tag_id: str, threshold: Optional[float] = None) -> bool:
         """Check if scan is within debounce threshold"""
-        threshold = threshold or self.SCAN_DEBOUNCE_SECONDS
-        now = time.monotonic()
-        last_scan = self._recent_scan_times.get(tag_id, 0)
+        threshold_ms = int((threshold or self.SCAN_DEBOUNCE_SECONDS) * 1000)
+        now_ms = time.monotonic_ns() // 1_000_000
+        last_scan_ms = self._recent_scan_times.get(tag_id)
         
-        if now - last_scan < threshold:
+        if last_scan_ms is not None and now_ms - last_scan_ms < threshold_ms:
             return True
         
-        self._recent_scan_times[tag_id] = now
+        self._store_scan_time(tag_id, now_ms)
         return False
     
     def record_scan(self, tag_id: str):
         """Record a scan timestamp"""
-        self._recent_scan_times[tag_id] = time.monotonic()
+        self._store_scan_time(tag_id, time.monotonic_ns() // 1_000_000)
+    
+    def _store_scan_time(self, tag_id: str, timestamp: int):
+        """Store scan time, evicting the least recently scanned tags beyond the cap"""
+        self._recent_scan_times[tag_id] = timestamp
+        self._recent_scan_times.move_to_end(tag_id)
+        while len(self._recent_scan_times) > self.MAX_TRACKED_SCANS:
+            self._recent_scan_times.popitem(last=False)
     
     @property
     def pending_identification(self) -> Optional[PendingIdentification]:
@@ -0,0 +1,79 @@
+"""
+Tests for the entry editor's IN/OUT realignment after deletes.
+"""
+import datetime
+import unittest
+from unittest import mock
+
+from src.data import database
+from src.data.database import DB_FILE, SQLITE_PRAGMAS, Employee, TimeEntry, db
+
+try:
+    from src.presentation.popups import entry_editor_popup
+except ImportError:  # Kivy is not installed
+    entry_editor_popup = None
+
+
+@unittest.skipIf(entry_editor_popup is None, "Kivy is not installed")
+class DeleteRealignTest(unittest.TestCase):
+    """A delete in the middle of the sequence realigns all later entries"""
+
+    def setUp(self):
+        db.close()
+        db.init(':memory:')
+        db.connect()
+        db.create_tables([Employee, TimeEntry])
+        self.employee = Employee.create(name="Test Person", rfid_tag="TEST0001")
+        start = datetime.datetime(2026, 3, 2, 8, 0)
+        self.entries = [
+            TimeEntry.create(employee=self.employee, action=action,
+                             timestamp=start + datetime.timedelta(hours=hour))
+            for hour, action in enumerate(('in', 'out', 'in', 'out', 'in'))
+        ]
+        # Skip Popup.__init__; the delete task only needs the employee and the day
+        self.editor = entry_editor_popup.EntryEditorPopup.__new__(entry_editor_popup.EntryEditorPopup)
+        self.editor.employee = self.employee
+        self.editor._employee_lock = database._get_employee_lock(self.employee.id)
+        self.editor._day_range = entry_editor_popup._day_bounds(start.date())
+
+    def tearDown(self):
+        db.close()
+        db.init(DB_FILE, pragmas=SQLITE_PRAGMAS)
+
+    def _delete_middle_entry(self):
+        deleted = self.entries[1]
+        remaining = [e for e in self.entries if e.id != deleted.id]
+        return self.editor._delete_entries_task(
+            [deleted.id], deleted.timestamp, remaining, self.editor._day_range
+        )
+
+    def _assert_realigned(self, day_rows):
+        expected = ['in', 'out', 'in', 'out']
+        self.assertEqual([row.action for row in day_rows], expected)
+        actions = [entry.action for entry in TimeEntry.select().where(
+            TimeEntry.active == True
+        ).order_by(TimeEntry.timestamp)]
+        self.assertEqual(actions, expected)
+
+    @unittest.skipUnless(entry_editor_popup and entry_editor_popup._SQL_REALIGN_SUPPORTED,
+                         "SQLite is older than 3.33")
+    def test_delete_realigns_in_sqlite(self):
+        with mock.patch.object(entry_editor_popup.EntryEditorPopup, '_recalculate_all_actions') as recalc:
+            day_rows = self._delete_middle_entry()
+        recalc.assert_not_called()
+        self._assert_realigned(day_rows)
+
+    def test_delete_realigns_in_python_on_old_sqlite(self):
+        with mock.patch.object(entry_editor_popup, '_SQL_REALIGN_SUPPORTED', False):
+            day_rows = self._delete_middle_entry()
+        self._assert_realigned(day_rows)
+
+    def test_delete_realigns_in_python_when_statement_fails(self):
+        with mock.patch.object(entry_editor_popup, '_SQL_REALIGN_SUPPORTED', True), \
+                mock.patch.object(entry_editor_popup, '_REALIGN_ACTIONS_SQL', "UPDATE missing_table SET x = ?"):
+            day_rows = self._delete_middle_entry()
+        self._assert_realigned(day_rows)
+
+
+if __name__ == '__main__':
+    unittest.main()